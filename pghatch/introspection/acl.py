@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import List, Dict, Optional, Any, TYPE_CHECKING
 from pghatch.introspection.tables import PgRoles
 
@@ -89,7 +89,8 @@ ACL_MAP_ENTRIES = sorted(
 )
 
 
-@dataclass
+# Parsed ACLs are cached per introspection and shared between objects.
+@dataclass(frozen=True)
 class AclObject:
     role: str
     granter: str
@@ -142,9 +143,9 @@ def parse_identifier(s: str) -> str:
 def get_role(introspection: "Introspection", oid: str) -> PgRoles:
     if oid == "0":
         return PUBLIC_ROLE
-    for role in introspection.roles:
-        if getattr(role, "oid", None) == oid or getattr(role, "_id", None) == oid:
-            return role
+    role = introspection.get_role(oid)
+    if role is not None:
+        return role
     raise ValueError(f"Could not find role with identifier '{oid}'")
 
 
@@ -152,7 +153,7 @@ def get_role_by_name(introspection: "Introspection", name: str) -> PgRoles:
     if name == "public":
         return PUBLIC_ROLE
     for role in introspection.roles:
-        if getattr(role, "rolname", None) == name:
+        if role.rolname == name:
             return role
     raise ValueError(f"Could not find role with name '{name}'")
 
@@ -160,12 +161,13 @@ def get_role_by_name(introspection: "Introspection", name: str) -> PgRoles:
 def parse_acl(acl_string: str) -> AclObject:
     if len(acl_string) < 3:
         raise ValueError("Invalid ACL string: too few characters")
-    acl = AclObject(**NO_PERMISSIONS.__dict__)
     equals_sign_index = acl_string.find("=")
     if equals_sign_index == -1:
         raise ValueError(f"Could not parse ACL string '{acl_string}' - no '=' symbol")
+    # AclObject is frozen, so collect the fields and build it at the end
+    fields = {}
     if equals_sign_index > 0:
-        acl.role = parse_identifier(acl_string[:equals_sign_index])
+        fields["role"] = parse_identifier(acl_string[:equals_sign_index])
     i = equals_sign_index
     last_character_index = len(acl_string) - 1
     while i + 1 < len(acl_string):
@@ -175,17 +177,17 @@ def parse_acl(acl_string: str) -> AclObject:
             i += 1
             if i == len(acl_string):
                 raise ValueError("ACL string should have a granter after the /")
-            acl.granter = parse_identifier(acl_string[i:])
-            return acl
+            fields["granter"] = parse_identifier(acl_string[i:])
+            return replace(NO_PERMISSIONS, **fields)
         perm = ACL_MAP.get(char)
         if perm is None:
             raise ValueError(
                 f"Could not parse ACL string '{acl_string}' - unsupported permission '{char}'"
             )
-        setattr(acl, perm, True)
+        fields[perm] = True
         if i < last_character_index and acl_string[i + 1] == "*":
             i += 1
-            setattr(acl, f"{perm}Grant", True)
+            fields[f"{perm}Grant"] = True
     raise ValueError(
         f"Invalid or unsupported ACL string '{acl_string}' - no '/' character?"
     )
@@ -217,55 +219,60 @@ def parse_acls(
     owner_id: str,
     objtype: str,
 ) -> List[AclObject]:
-    acl_strings = in_acls
-    if acl_strings is None:
-        owner = get_role(introspection, owner_id)
-        if objtype == OBJECT_COLUMN:
-            world_default = ACL_NO_RIGHTS
-            owner_default = ACL_NO_RIGHTS
-        elif objtype == OBJECT_TABLE:
-            world_default = ACL_NO_RIGHTS
-            owner_default = ACL_ALL_RIGHTS_RELATION
-        elif objtype == OBJECT_SEQUENCE:
-            world_default = ACL_NO_RIGHTS
-            owner_default = ACL_ALL_RIGHTS_SEQUENCE
-        elif objtype == OBJECT_DATABASE:
-            world_default = f"{ACL_CREATE_TEMP}{ACL_CONNECT}"
-            owner_default = ACL_ALL_RIGHTS_DATABASE
-        elif objtype == OBJECT_FUNCTION:
-            world_default = ACL_EXECUTE
-            owner_default = ACL_ALL_RIGHTS_FUNCTION
-        elif objtype == OBJECT_LANGUAGE:
-            world_default = ACL_USAGE
-            owner_default = ACL_ALL_RIGHTS_LANGUAGE
-        elif objtype == OBJECT_LARGEOBJECT:
-            world_default = ACL_NO_RIGHTS
-            owner_default = ACL_ALL_RIGHTS_LARGEOBJECT
-        elif objtype == OBJECT_SCHEMA:
-            world_default = ACL_NO_RIGHTS
-            owner_default = ACL_ALL_RIGHTS_SCHEMA
-        elif objtype == OBJECT_TABLESPACE:
-            world_default = ACL_NO_RIGHTS
-            owner_default = ACL_ALL_RIGHTS_TABLESPACE
-        elif objtype == OBJECT_FDW:
-            world_default = ACL_NO_RIGHTS
-            owner_default = ACL_ALL_RIGHTS_FDW
-        elif objtype == OBJECT_FOREIGN_SERVER:
-            world_default = ACL_NO_RIGHTS
-            owner_default = ACL_ALL_RIGHTS_FOREIGN_SERVER
-        elif objtype in (OBJECT_DOMAIN, OBJECT_TYPE):
-            world_default = ACL_USAGE
-            owner_default = ACL_ALL_RIGHTS_TYPE
-        else:
-            world_default = ACL_NO_RIGHTS
-            owner_default = ACL_NO_RIGHTS
-        acl = []
-        if world_default != ACL_NO_RIGHTS:
-            acl.append(f"={world_default}/{owner.rolname}")
-        if owner_default != ACL_NO_RIGHTS:
-            acl.append(f"{owner.rolname}={owner_default}/{owner.rolname}")
-        acl_strings = acl
-    return [parse_acl(s) for s in acl_strings]
+    if in_acls is not None:
+        return [introspection.get_parsed_acl(s) for s in in_acls]
+    return list(introspection.get_default_acls(owner_id, objtype))
+
+
+def parse_default_acls(
+    introspection: "Introspection", owner_id: str, objtype: str
+) -> List[AclObject]:
+    owner = get_role(introspection, owner_id)
+    if objtype == OBJECT_COLUMN:
+        world_default = ACL_NO_RIGHTS
+        owner_default = ACL_NO_RIGHTS
+    elif objtype == OBJECT_TABLE:
+        world_default = ACL_NO_RIGHTS
+        owner_default = ACL_ALL_RIGHTS_RELATION
+    elif objtype == OBJECT_SEQUENCE:
+        world_default = ACL_NO_RIGHTS
+        owner_default = ACL_ALL_RIGHTS_SEQUENCE
+    elif objtype == OBJECT_DATABASE:
+        world_default = f"{ACL_CREATE_TEMP}{ACL_CONNECT}"
+        owner_default = ACL_ALL_RIGHTS_DATABASE
+    elif objtype == OBJECT_FUNCTION:
+        world_default = ACL_EXECUTE
+        owner_default = ACL_ALL_RIGHTS_FUNCTION
+    elif objtype == OBJECT_LANGUAGE:
+        world_default = ACL_USAGE
+        owner_default = ACL_ALL_RIGHTS_LANGUAGE
+    elif objtype == OBJECT_LARGEOBJECT:
+        world_default = ACL_NO_RIGHTS
+        owner_default = ACL_ALL_RIGHTS_LARGEOBJECT
+    elif objtype == OBJECT_SCHEMA:
+        world_default = ACL_NO_RIGHTS
+        owner_default = ACL_ALL_RIGHTS_SCHEMA
+    elif objtype == OBJECT_TABLESPACE:
+        world_default = ACL_NO_RIGHTS
+        owner_default = ACL_ALL_RIGHTS_TABLESPACE
+    elif objtype == OBJECT_FDW:
+        world_default = ACL_NO_RIGHTS
+        owner_default = ACL_ALL_RIGHTS_FDW
+    elif objtype == OBJECT_FOREIGN_SERVER:
+        world_default = ACL_NO_RIGHTS
+        owner_default = ACL_ALL_RIGHTS_FOREIGN_SERVER
+    elif objtype in (OBJECT_DOMAIN, OBJECT_TYPE):
+        world_default = ACL_USAGE
+        owner_default = ACL_ALL_RIGHTS_TYPE
+    else:
+        world_default = ACL_NO_RIGHTS
+        owner_default = ACL_NO_RIGHTS
+    acl = []
+    if world_default != ACL_NO_RIGHTS:
+        acl.append(f"={world_default}/{owner.rolname}")
+    if owner_default != ACL_NO_RIGHTS:
+        acl.append(f"{owner.rolname}={owner_default}/{owner.rolname}")
+    return [parse_acl(s) for s in acl]
 
 
 Permission = {
@@ -310,11 +317,8 @@ def expand_roles(
             all_roles.append(member)
             if include_no_inherit or getattr(member, "rolinherit", True):
                 for am in introspection.auth_members:
-                    if getattr(am, "member", None) == getattr(
-                        member, "oid", None
-                    ) or getattr(am, "member", None) == getattr(member, "_id", None):
-                        rol = get_role(introspection, getattr(am, "roleid", None))
-                        add_role(rol)
+                    if am.member == member.oid:
+                        add_role(get_role(introspection, am.roleid))
 
     for r in roles:
         add_role(r)
@@ -371,7 +375,7 @@ def entity_permissions(
     is_owner_and_has_no_explicit_acls = (
         owner is not None
         and owner == role
-        and not any(acl.role == getattr(owner, "rolname", None) for acl in acls)
+        and not any(acl.role == owner.rolname for acl in acls)
         and (
             getattr(entity, "_type", None) != "PgAttribute"
             or not (
@@ -380,7 +384,7 @@ def entity_permissions(
                 and hasattr(entity.get_class(), "get_acl")
                 and callable(entity.get_class().get_acl)
                 and any(
-                    acl.role == getattr(owner, "rolname", None)
+                    acl.role == owner.rolname
                     for acl in entity.get_class().get_acl()
                 )
             )
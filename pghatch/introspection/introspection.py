@@ -1,7 +1,10 @@
-from typing import Any
+import json
+from collections import defaultdict
+from operator import attrgetter
+from typing import Any, Iterable, get_origin
 
 from asyncpg import Connection
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
 
 from pghatch.introspection.tables import (
     PgDatabase,
@@ -23,7 +26,9 @@ from pghatch.introspection.tables import (
     PgDescription,
     PgAm,
     PgRoles,
+    ProcArgument,
 )
+from pghatch.introspection import acl
 
 
 class Introspection(BaseModel):
@@ -62,6 +67,82 @@ class Introspection(BaseModel):
     PG_TYPE: str | None = None
     PG_CONSTRAINT: str | None = None
     PG_EXTENSION: str | None = None
+    PG_ENUM: str | None = None
+
+    # OID -> object indexes, built once in model_post_init
+    _roles_by_oid: dict[str, "PgRoles"] = PrivateAttr(default_factory=dict)
+    _namespaces_by_oid: dict[str, "PgNamespace"] = PrivateAttr(default_factory=dict)
+    _types_by_oid: dict[str, "PgType"] = PrivateAttr(default_factory=dict)
+    _classes_by_oid: dict[str, "PgClass"] = PrivateAttr(default_factory=dict)
+    _ranges_by_rngtypid: dict[str, "PgRange"] = PrivateAttr(default_factory=dict)
+    _constraints_by_oid: dict[str, "PgConstraint"] = PrivateAttr(
+        default_factory=dict
+    )
+    _procs_by_oid: dict[str, "PgProc"] = PrivateAttr(default_factory=dict)
+    _enums_by_oid: dict[str, "PgEnum"] = PrivateAttr(default_factory=dict)
+    _extensions_by_oid: dict[str, "PgExtension"] = PrivateAttr(default_factory=dict)
+    _indexes_by_indexrelid: dict[str, "PgIndex"] = PrivateAttr(default_factory=dict)
+    _languages_by_oid: dict[str, "PgLanguage"] = PrivateAttr(default_factory=dict)
+    _am_by_oid: dict[str, "PgAm"] = PrivateAttr(default_factory=dict)
+
+    # parent OID -> children indexes, pre-sorted where the accessor sorts
+    _attributes_by_relid: dict[str, tuple["PgAttribute", ...]] = PrivateAttr(
+        default_factory=dict
+    )
+    _attributes_by_relid_name: dict[str, dict[str, "PgAttribute"]] = PrivateAttr(
+        default_factory=dict
+    )
+    _constraints_by_conrelid: dict[str, tuple["PgConstraint", ...]] = PrivateAttr(
+        default_factory=dict
+    )
+    _constraints_by_conrelid_type: dict[
+        tuple[str, str], tuple["PgConstraint", ...]
+    ] = PrivateAttr(default_factory=dict)
+    _constraints_by_confrelid: dict[str, tuple["PgConstraint", ...]] = PrivateAttr(
+        default_factory=dict
+    )
+    _enums_by_typid: dict[str, tuple["PgEnum", ...]] = PrivateAttr(default_factory=dict)
+    _indexes_by_indrelid: dict[str, tuple["PgIndex", ...]] = PrivateAttr(
+        default_factory=dict
+    )
+    _inherits_by_inhrelid: dict[str, tuple["PgInherits", ...]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    # (namespace oid, name) -> object
+    _classes_by_nsp_name: dict[tuple[str, str], "PgClass"] = PrivateAttr(
+        default_factory=dict
+    )
+    _constraints_by_nsp_name: dict[tuple[str, str], "PgConstraint"] = PrivateAttr(
+        default_factory=dict
+    )
+    _procs_by_nsp_name: dict[tuple[str, str], tuple["PgProc", ...]] = PrivateAttr(
+        default_factory=dict
+    )
+
+    # proc oid -> ProcArgument tuple, filled lazily by get_proc_arguments
+    _proc_arguments: dict[str, tuple["ProcArgument", ...]] = PrivateAttr(
+        default_factory=dict
+    )
+    # argument signature -> ProcArgument, shared by procs with equal arguments
+    _proc_argument_pool: dict[tuple, "ProcArgument"] = PrivateAttr(
+        default_factory=dict
+    )
+
+    # (owner oid, object type) -> parsed default ACL, filled lazily
+    _default_acls: dict[tuple[str, str], tuple["acl.AclObject", ...]] = PrivateAttr(
+        default_factory=dict
+    )
+    # aclitem string -> parsed AclObject; the same grants repeat across objects
+    _parsed_acls: dict[str, "acl.AclObject"] = PrivateAttr(default_factory=dict)
+
+    # (classoid, objoid[, objsubid]) -> description
+    _descriptions_by_key: dict[tuple, "PgDescription"] = PrivateAttr(
+        default_factory=dict
+    )
+    _descriptions_by_obj: dict[tuple, "PgDescription"] = PrivateAttr(
+        default_factory=dict
+    )
 
     @classmethod
     def del_items(cls, delete: list[Any], collection: list[Any], attr: str) -> None:
@@ -81,6 +162,8 @@ class Introspection(BaseModel):
         self.PG_PROC = self.oid_by_catalog.get("pg_proc")
         self.PG_TYPE = self.oid_by_catalog.get("pg_type")
         self.PG_CONSTRAINT = self.oid_by_catalog.get("pg_constraint")
+        self.PG_EXTENSION = self.oid_by_catalog.get("pg_extension")
+        self.PG_ENUM = self.oid_by_catalog.get("pg_enum")
 
         if not all(
             [
@@ -102,11 +185,11 @@ class Introspection(BaseModel):
             for dependency in self.depends:
                 if (
                     dependency.deptype == "e"
-                    and self.oid_by_catalog.get("pg_extension") == dependency.refclassid
+                    and self.PG_EXTENSION == dependency.refclassid
                 ):
-                    if dependency.classid == self.oid_by_catalog.get("pg_proc"):
+                    if dependency.classid == self.PG_PROC:
                         extension_proc_oids.add(dependency.objid)
-                    elif dependency.classid == self.oid_by_catalog.get("pg_class"):
+                    elif dependency.classid == self.PG_CLASS:
                         extension_class_oids.add(dependency.objid)
 
             extension_proc_oids = list(extension_proc_oids)
@@ -118,171 +201,310 @@ class Introspection(BaseModel):
             self.del_items(extension_class_oids, self.constraints, "confrelid")
             self.del_items(extension_class_oids, self.type, "typrelid")
 
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Index the catalog lists by OID so the get_* lookups are O(1)."""
+        self._roles_by_oid = {r.oid: r for r in self.roles}
+        self._namespaces_by_oid = {n.oid: n for n in self.namespaces}
+        self._types_by_oid = {t.oid: t for t in self.types}
+        self._classes_by_oid = {c.oid: c for c in self.classes}
+        self._ranges_by_rngtypid = {r.rngtypid: r for r in self.ranges}
+        self._constraints_by_oid = {c.oid: c for c in self.constraints}
+        self._procs_by_oid = {p.oid: p for p in self.procs}
+        self._enums_by_oid = {e.oid: e for e in self.enums}
+        self._extensions_by_oid = {e.oid: e for e in self.extensions}
+        self._indexes_by_indexrelid = {i.indexrelid: i for i in self.indexes}
+        self._languages_by_oid = {lang.oid: lang for lang in self.languages}
+        self._am_by_oid = {am.oid: am for am in self.am}
+
+        self._attributes_by_relid = self._group_by(
+            self.attributes, "attrelid", sort_key="attnum"
+        )
+        self._attributes_by_relid_name = {
+            relid: {a.attname: a for a in attrs}
+            for relid, attrs in self._attributes_by_relid.items()
+        }
+        self._constraints_by_conrelid = self._group_by(
+            self.constraints, "conrelid", sort_key="conname"
+        )
+        self._constraints_by_conrelid_type = {
+            (relid, contype): group
+            for relid, constraints in self._constraints_by_conrelid.items()
+            for contype, group in self._group_by(constraints, "contype").items()
+        }
+        self._constraints_by_confrelid = self._group_by(self.constraints, "confrelid")
+        self._enums_by_typid = self._group_by(
+            self.enums, "enumtypid", sort_key="enumsortorder"
+        )
+        self._indexes_by_indrelid = self._group_by(self.indexes, "indrelid")
+        self._inherits_by_inhrelid = self._group_by(self.inherits, "inhrelid")
+
+        self._classes_by_nsp_name = {
+            (c.relnamespace, c.relname): c for c in self.classes
+        }
+        # constraint names are only unique per relation; keep the first match
+        self._constraints_by_nsp_name = {}
+        for c in self.constraints:
+            self._constraints_by_nsp_name.setdefault((c.connamespace, c.conname), c)
+        self._procs_by_nsp_name = self._group_by(
+            self.procs, ("pronamespace", "proname")
+        )
+
+        self._descriptions_by_key = {}
+        self._descriptions_by_obj = {}
+        for d in self.descriptions:
+            self._descriptions_by_key[(d.classoid, d.objoid, d.objsubid)] = d
+            # Without an objsubid the first description of the object wins,
+            # matching the objsubid ordering of the introspection query.
+            self._descriptions_by_obj.setdefault((d.classoid, d.objoid), d)
+
+    @staticmethod
+    def _group_by(
+        collection: list[Any],
+        attr: str | tuple[str, ...],
+        sort_key: str | None = None,
+    ) -> dict[Any, tuple[Any, ...]]:
+        groups = defaultdict(list)
+        # several attribute names group by the tuple of their values
+        key = attrgetter(*attr) if isinstance(attr, tuple) else attrgetter(attr)
+        for item in collection:
+            groups[key(item)].append(item)
+        if sort_key is not None:
+            for group in groups.values():
+                group.sort(key=attrgetter(sort_key))
+        # the catalog is read-only after load, so the buckets are shared tuples
+        return {k: tuple(group) for k, group in groups.items()}
+
     def get_role(self, oid: str | None = None) -> "PgRoles | None":
         """Get a role by its OID."""
-        for role in self.roles:
-            if role.oid == oid:
-                return role
-        return None
+        return self._roles_by_oid.get(oid)
 
     def get_namespace(self, id: str | None) -> "PgNamespace | None":
-        return next(
-            (ns for ns in self.namespaces if getattr(ns, "oid", None) == id), None
-        )
+        return self._namespaces_by_oid.get(id)
 
     def get_type(self, id: str | None) -> "PgType | None":
-        return next((t for t in self.types if getattr(t, "oid", None) == id), None)
+        return self._types_by_oid.get(id)
+
+    def get_types(self, ids: Iterable[str]) -> dict[str, "PgType"]:
+        """Resolve several type OIDs at once; unknown OIDs are left out."""
+        types = self._types_by_oid
+        return {id: types[id] for id in set(ids) if id in types}
 
     def get_class(self, id: str | None) -> "PgClass | None":
-        return next((c for c in self.classes if getattr(c, "oid", None) == id), None)
+        return self._classes_by_oid.get(id)
 
     def get_range(self, id: str | None) -> "PgRange | None":
-        return next(
-            (r for r in self.ranges if getattr(r, "rngtypid", None) == id), None
-        )
+        return self._ranges_by_rngtypid.get(id)
 
-    def get_attributes(self, id: str | None) -> list["PgAttribute"]:
-        return sorted(
-            [a for a in self.attributes if getattr(a, "attrelid", None) == id],
-            key=lambda a: getattr(a, "attnum", 0),
-        )
+    def get_attributes(self, id: str | None) -> tuple["PgAttribute", ...]:
+        return self._attributes_by_relid.get(id, ())
 
-    def get_constraints(self, id: str | None) -> list["PgConstraint"]:
-        return sorted(
-            [c for c in self.constraints if getattr(c, "conrelid", None) == id],
-            key=lambda c: getattr(c, "conname", ""),
-        )
+    def get_attribute_by_num(
+        self, id: str | None, attnum: int
+    ) -> "PgAttribute | None":
+        attrs = self._attributes_by_relid.get(id, ())
+        # attributes are sorted by attnum and start at 1; dropped columns are
+        # kept, so the position matches unless the catalog has gaps.
+        if 0 < attnum <= len(attrs) and attrs[attnum - 1].attnum == attnum:
+            return attrs[attnum - 1]
+        return next((a for a in attrs if a.attnum == attnum), None)
 
-    def get_foreign_constraints(self, id: str | None) -> list["PgConstraint"]:
-        return [c for c in self.constraints if getattr(c, "confrelid", None) == id]
+    def get_attributes_by_name(self, id: str | None) -> dict[str, "PgAttribute"]:
+        return self._attributes_by_relid_name.get(id, {})
 
-    def get_enums(self, id: str | None) -> list["PgEnum"]:
-        return sorted(
-            [e for e in self.enums if getattr(e, "enumtypid", None) == id],
-            key=lambda e: getattr(e, "enumsortorder", 0),
-        )
+    def get_attribute_by_name(
+        self, id: str | None, attname: str
+    ) -> "PgAttribute | None":
+        return self.get_attributes_by_name(id).get(attname)
+
+    def get_constraints(self, id: str | None) -> tuple["PgConstraint", ...]:
+        return self._constraints_by_conrelid.get(id, ())
+
+    def get_constraints_by_type(
+        self, id: str | None, contype: str
+    ) -> tuple["PgConstraint", ...]:
+        return self._constraints_by_conrelid_type.get((id, contype), ())
+
+    def get_class_by_name(self, namespace: str | None, name: str) -> "PgClass | None":
+        return self._classes_by_nsp_name.get((namespace, name))
+
+    def get_constraint_by_name(
+        self, namespace: str | None, name: str
+    ) -> "PgConstraint | None":
+        return self._constraints_by_nsp_name.get((namespace, name))
 
-    def get_indexes(self, id: str | None) -> list["PgIndex"]:
-        return [i for i in self.indexes if getattr(i, "indrelid", None) == id]
+    def get_procs_by_name(
+        self, namespace: str | None, name: str
+    ) -> tuple["PgProc", ...]:
+        return self._procs_by_nsp_name.get((namespace, name), ())
+
+    def get_foreign_constraints(self, id: str | None) -> tuple["PgConstraint", ...]:
+        return self._constraints_by_confrelid.get(id, ())
+
+    def get_enums(self, id: str | None) -> tuple["PgEnum", ...]:
+        return self._enums_by_typid.get(id, ())
+
+    def get_indexes(self, id: str | None) -> tuple["PgIndex", ...]:
+        return self._indexes_by_indrelid.get(id, ())
+
+    def get_inherits(self, id: str | None) -> tuple["PgInherits", ...]:
+        return self._inherits_by_inhrelid.get(id, ())
+
+    def get_am(self, id: str | None) -> "PgAm | None":
+        return self._am_by_oid.get(id)
 
     def get_description(
         self, classoid: str, objoid: str, objsubid: int | None = None
     ) -> str | None:
+        desc = self._find_description(classoid, objoid, objsubid)
+        return desc.description if desc else None
+
+    def _find_description(
+        self, classoid: str, objoid: str, objsubid: int | None = None
+    ) -> "PgDescription | None":
         if objsubid is None:
-            desc = next(
-                (
-                    d
-                    for d in self.descriptions
-                    if d.classoid == classoid and d.objoid == objoid
-                ),
-                None,
-            )
-        else:
-            desc = next(
-                (
-                    d
-                    for d in self.descriptions
-                    if d.classoid == classoid
-                    and d.objoid == objoid
-                    and d.objsubid == objsubid
-                ),
-                None,
-            )
-        return getattr(desc, "description", None) if desc else None
+            return self._descriptions_by_obj.get((classoid, objoid))
+        return self._descriptions_by_key.get((classoid, objoid, objsubid))
 
     def get_tags_and_description(
         self,
         classoid: str,
         objoid: str,
         objsubid: int | None = None,
-        fallback: dict | None = None,
+        fallback: tuple | None = None,
     ) -> dict:
-        description = self.get_description(classoid, objoid, objsubid)
-        if description is None and fallback:
-            description = self.get_description(
-                fallback.get("classoid"),
-                fallback.get("objoid"),
-                fallback.get("objsubid"),
-            )
+        # fallback is a (classoid, objoid[, objsubid]) key of another object
+        desc = self._find_description(classoid, objoid, objsubid) or (
+            self._find_description(*fallback) if fallback else None
+        )
+        description = desc.description if desc else None
         # parseSmartComment is not defined; return as dict for now
         return {"description": description}
 
+    def get_tags(
+        self, classoid: str, objoid: str, objsubid: int | None = None
+    ) -> list | None:
+        # smart comment tags are not parsed yet, so there is nothing to look up
+        return None
+
     def get_current_user(self):
         return next((r for r in self.roles if r.rolname == self.current_user), None)
 
     def get_constraint(self, by: dict) -> "PgConstraint | None":
-        return next(
-            (c for c in self.constraints if getattr(c, "oid", None) == by.get("oid")),
-            None,
-        )
+        return self._constraints_by_oid.get(by.get("oid"))
 
     def get_proc(self, id: str) -> "PgProc | None":
-        return next((c for c in self.procs if getattr(c, "oid", None) == id), None)
+        return self._procs_by_oid.get(id)
+
+    def get_proc_arguments(self, proc: "PgProc") -> tuple["ProcArgument", ...]:
+        # resolvers ask for the arguments on every call; build them once
+        arguments = self._proc_arguments.get(proc.oid)
+        if arguments is None:
+            arguments = self._proc_arguments[proc.oid] = tuple(
+                proc.build_arguments(self)
+            )
+        return arguments
+
+    def get_proc_argument(
+        self,
+        is_in: bool,
+        is_out: bool,
+        is_variadic: bool,
+        has_default: bool,
+        typ: "PgType",
+        name: str | None,
+    ) -> "ProcArgument":
+        # overloads and trivial signatures share one ProcArgument
+        key = (is_in, is_out, is_variadic, has_default, typ.oid, name)
+        argument = self._proc_argument_pool.get(key)
+        if argument is None:
+            argument = self._proc_argument_pool[key] = ProcArgument(
+                is_in=is_in,
+                is_out=is_out,
+                is_variadic=is_variadic,
+                has_default=has_default,
+                typ=typ,
+                name=name,
+            )
+        return argument
+
+    def get_parsed_acl(self, acl_string: str) -> "acl.AclObject":
+        # explicit grants like "postgres=arwdDxtm/postgres" repeat across
+        # objects, so each distinct aclitem is parsed once
+        parsed = self._parsed_acls.get(acl_string)
+        if parsed is None:
+            parsed = self._parsed_acls[acl_string] = acl.parse_acl(acl_string)
+        return parsed
+
+    def get_default_acls(
+        self, owner_id: str, objtype: str
+    ) -> tuple["acl.AclObject", ...]:
+        # most objects carry no explicit ACL, so the owner/type default is
+        # parsed once and shared
+        key = (owner_id, objtype)
+        defaults = self._default_acls.get(key)
+        if defaults is None:
+            defaults = self._default_acls[key] = tuple(
+                acl.parse_default_acls(self, owner_id, objtype)
+            )
+        return defaults
 
     def get_roles(self, by: dict) -> "PgRoles | None":
-        return next(
-            (c for c in self.roles if getattr(c, "oid", None) == by.get("oid")), None
-        )
+        return self._roles_by_oid.get(by.get("oid"))
 
     def get_enum(self, by: dict) -> "PgEnum | None":
-        return next(
-            (c for c in self.enums if getattr(c, "oid", None) == by.get("oid")), None
-        )
+        return self._enums_by_oid.get(by.get("oid"))
 
     def get_extension(self, by: dict) -> "PgExtension | None":
-        return next(
-            (c for c in self.extensions if getattr(c, "_id", None) == by.get("id")),
-            None,
-        )
+        return self._extensions_by_oid.get(by.get("id"))
 
     def get_index(self, by: dict) -> "PgIndex | None":
-        return next(
-            (c for c in self.indexes if getattr(c, "indexrelid", None) == by.get("id")),
-            None,
-        )
+        return self._indexes_by_indexrelid.get(by.get("id"))
 
     def get_language(self, by: dict) -> "PgLanguage | None":
-        return next(
-            (c for c in self.languages if getattr(c, "_id", None) == by.get("id")), None
-        )
+        return self._languages_by_oid.get(by.get("id"))
 
 
-async def make_introspection_query(conn: Connection) -> Introspection:
-    introspection_query = """
+_CATALOG_ADAPTERS: dict[str, TypeAdapter] = {
+    name: TypeAdapter(field.annotation)
+    for name, field in Introspection.model_fields.items()
+    if get_origin(field.annotation) is list
+}
+
+
+# asyncpg prepares this once per pooled connection and serves later
+# introspections from its statement cache.
+INTROSPECTION_QUERY = """
                           with database as (select *
                                             from pg_catalog.pg_database
                                             where datname = current_database()),
 
-                               namespaces as (select *
+                               namespaces as materialized (select *
                                               from pg_catalog.pg_namespace
                                               where nspname <> 'information_schema'),
 
-                               classes as (select *,
+                               user_namespaces as materialized (select oid
+                                                   from namespaces
+                                                   where nspname not like 'pg\\_%'),
+
+                               classes as materialized (select *,
                                                   pg_catalog.pg_relation_is_updatable(oid, true) ::bit(8)::int4 as "updatable_mask"
                                            from pg_catalog.pg_class
-                                           where relnamespace in (select namespaces.oid
-                                                                  from namespaces
-                                                                  where nspname <> 'information_schema'
-                                                                    and nspname not like 'pg\\_%')),
+                                           where relnamespace in (select oid from user_namespaces)),
 
                                attributes as (select *
                                               from pg_catalog.pg_attribute
                                               where attrelid in (select classes.oid from classes)
                                                 AND attnum > 0),
 
-                               constraints as (select *
+                               constraints as materialized (select *
                                                from pg_catalog.pg_constraint
-                                               where connamespace in (select namespaces.oid
-                                                                      from namespaces
-                                                                      where nspname <> 'information_schema'
-                                                                        and nspname not like 'pg\\_%')),
+                                               where connamespace in (select oid from user_namespaces)),
 
-                               procs as (select *
+                               procs as materialized (select *
                                          from pg_catalog.pg_proc
-                                         where pronamespace in (select namespaces.oid
-                                                                from namespaces
-                                                                where nspname <> 'information_schema'
-                                                                  and nspname not like 'pg\\_%')
+                                         where pronamespace in (select oid from user_namespaces)
                                            and prorettype operator(pg_catalog.<>) 2279
                               ), roles as (
                           select *
@@ -292,19 +514,18 @@ async def make_introspection_query(conn: Connection) -> Introspection:
                           from pg_catalog.pg_auth_members
                           where roleid in (select roles.oid from roles)
                               )
-                              , types as (
+                              , types as materialized (
                           select *
                           from pg_catalog.pg_type
-                          where (typnamespace in (select namespaces.oid from namespaces where nspname <> 'information_schema'
-                            and nspname not like 'pg\\_%'))
+                          where (typnamespace in (select oid from user_namespaces))
                              or (typnamespace = 'pg_catalog'::regnamespace)
                               )
-                              , enums as (
+                              , enums as materialized (
                           select *
                           from pg_catalog.pg_enum
                           where enumtypid in (select types.oid from types)
                               )
-                              , extensions as (
+                              , extensions as materialized (
                           select *
                           from pg_catalog.pg_extension
                               ), indexes as (
@@ -335,149 +556,139 @@ async def make_introspection_query(conn: Connection) -> Introspection:
                           from pg_catalog.pg_depend
                           where deptype IN ('a'
                               , 'e')
-                            and (
-                              (classid = 'pg_catalog.pg_namespace'::regclass
-                            and objid in (select namespaces.oid from namespaces))
-                             or (classid = 'pg_catalog.pg_class'::regclass
-                            and objid in (select classes.oid from classes))
-                             or (classid = 'pg_catalog.pg_attribute'::regclass
-                            and objid in (select classes.oid from classes)
-                            and objsubid
-                              > 0)
-                             or (classid = 'pg_catalog.pg_constraint'::regclass
-                            and objid in (select constraints.oid from constraints))
-                             or (classid = 'pg_catalog.pg_proc'::regclass
-                            and objid in (select procs.oid from procs))
-                             or (classid = 'pg_catalog.pg_type'::regclass
-                            and objid in (select types.oid from types))
-                             or (classid = 'pg_catalog.pg_enum'::regclass
-                            and objid in (select enums.oid from enums))
-                             or (classid = 'pg_catalog.pg_extension'::regclass
-                            and objid in (select extensions.oid from extensions))
+                            and (classid, objid) in (
+                                select 'pg_catalog.pg_namespace'::regclass::oid, oid from namespaces
+                                union all
+                                select 'pg_catalog.pg_class'::regclass::oid, oid from classes
+                                union all
+                                select 'pg_catalog.pg_attribute'::regclass::oid, oid from classes
+                                union all
+                                select 'pg_catalog.pg_constraint'::regclass::oid, oid from constraints
+                                union all
+                                select 'pg_catalog.pg_proc'::regclass::oid, oid from procs
+                                union all
+                                select 'pg_catalog.pg_type'::regclass::oid, oid from types
+                                union all
+                                select 'pg_catalog.pg_enum'::regclass::oid, oid from enums
+                                union all
+                                select 'pg_catalog.pg_extension'::regclass::oid, oid from extensions
                               )
+                            and (classid <> 'pg_catalog.pg_attribute'::regclass
+                             or objsubid > 0)
                               )
                               , descriptions as (
                           select *
                           from pg_catalog.pg_description
-                          where (
-                              (classoid = 'pg_catalog.pg_namespace'::regclass
-                            and objoid in (select namespaces.oid from namespaces))
-                             or (classoid = 'pg_catalog.pg_class'::regclass
-                            and objoid in (select classes.oid from classes))
-                             or (classoid = 'pg_catalog.pg_attribute'::regclass
-                            and objoid in (select classes.oid from classes)
-                            and objsubid
-                              > 0)
-                             or (classoid = 'pg_catalog.pg_constraint'::regclass
-                            and objoid in (select constraints.oid from constraints))
-                             or (classoid = 'pg_catalog.pg_proc'::regclass
-                            and objoid in (select procs.oid from procs))
-                             or (classoid = 'pg_catalog.pg_type'::regclass
-                            and objoid in (select types.oid from types))
-                             or (classoid = 'pg_catalog.pg_enum'::regclass
-                            and objoid in (select enums.oid from enums))
-                             or (classoid = 'pg_catalog.pg_extension'::regclass
-                            and objoid in (select extensions.oid from extensions))
+                          where (classoid, objoid) in (
+                                select 'pg_catalog.pg_namespace'::regclass::oid, oid from namespaces
+                                union all
+                                select 'pg_catalog.pg_class'::regclass::oid, oid from classes
+                                union all
+                                select 'pg_catalog.pg_attribute'::regclass::oid, oid from classes
+                                union all
+                                select 'pg_catalog.pg_constraint'::regclass::oid, oid from constraints
+                                union all
+                                select 'pg_catalog.pg_proc'::regclass::oid, oid from procs
+                                union all
+                                select 'pg_catalog.pg_type'::regclass::oid, oid from types
+                                union all
+                                select 'pg_catalog.pg_enum'::regclass::oid, oid from enums
+                                union all
+                                select 'pg_catalog.pg_extension'::regclass::oid, oid from extensions
                               )
+                            and (classoid <> 'pg_catalog.pg_attribute'::regclass
+                             or objsubid > 0)
                               )
                               , am as (
                           select *
                           from pg_catalog.pg_am
                           where true
                               )
-                          select json_build_object(
-                                         'database',
-                                         (select row_to_json(database) from database),
-                                         'namespaces',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(namespaces) order by nspname) from namespaces),
-                                                         '[]' ::json)),
-                                         'classes',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(classes) order by relnamespace, relname) from classes),
-                                                         '[]' ::json)),
-                                         'attributes',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(attributes) order by attrelid, attnum) from attributes),
-                                                         '[]' ::json)),
-                                         'constraints',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(constraints) order by connamespace, conrelid, conname) from constraints),
-                                                         '[]' ::json)),
-                                         'procs',
-                                         (select coalesce((select json_agg(row_to_json(procs) order by pronamespace,
-                                                                           proname,
-                                                                           pg_get_function_identity_arguments(procs.oid))
-                                                           from procs), '[]' ::json)),
-                                         'roles',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(roles) order by rolname) from roles),
-                                                         '[]' ::json)),
-                                         'auth_members',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(auth_members) order by roleid, member, grantor)
-                                                          from auth_members), '[]' ::json)),
-                                         'types',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(types) order by typnamespace, typname) from types),
-                                                         '[]' ::json)),
-                                         'enums',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(enums) order by enumtypid, enumsortorder) from enums),
-                                                         '[]' ::json)),
-                                         'extensions',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(extensions) order by extname) from extensions),
-                                                         '[]' ::json)),
-                                         'indexes',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(indexes) order by indrelid, indexrelid) from indexes),
-                                                         '[]' ::json)),
-                                         'inherits',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(inherits) order by inhrelid, inhseqno) from inherits),
-                                                         '[]' ::json)),
-                                         'languages',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(languages) order by lanname) from languages),
-                                                         '[]' ::json)),
-                                         'policies',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(policies) order by polrelid, polname) from policies),
-                                                         '[]' ::json)),
-                                         'ranges',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(ranges) order by rngtypid) from ranges),
-                                                         '[]' ::json)),
-                                         'depends',
-                                         (select coalesce((select json_agg(row_to_json(depends) order by classid, objid,
-                                                                           objsubid, refclassid, refobjid, refobjsubid)
-                                                           from depends), '[]' ::json)),
-                                         'descriptions',
-                                         (select coalesce(
-                                                         (select json_agg(row_to_json(descriptions) order by objoid, classoid, objsubid)
-                                                          from descriptions), '[]' ::json)),
-                                         'am',
-                                         (select coalesce((select json_agg(row_to_json(am) order by amname) from am), '[]'::json)),
-                                         'catalog_by_oid',
-                                         (select json_object_agg(oid::text, relname order by relname asc)
-                                          from pg_class
-                                          where relnamespace = (select oid
-                                                                from pg_namespace
-                                                                where nspname = 'pg_catalog')
-                                            and relkind = 'r'),
-                                         'current_user',
-                                         current_user,
-                                         'pg_version',
-                                         version(),
-                                         'introspection_version',
-                                         1
-                                 ) ::text as introspection \
+                          select
+                                 (select row_to_json(database) from database)::text as "database",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(namespaces) order by nspname) from namespaces),
+                                                 '[]' ::json))::text as "namespaces",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(classes) order by relnamespace, relname) from classes),
+                                                 '[]' ::json))::text as "classes",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(attributes) order by attrelid, attnum) from attributes),
+                                                 '[]' ::json))::text as "attributes",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(constraints) order by connamespace, conrelid, conname) from constraints),
+                                                 '[]' ::json))::text as "constraints",
+                                 (select coalesce((select json_agg(row_to_json(procs) order by pronamespace,
+                                                                   proname,
+                                                                   pg_get_function_identity_arguments(procs.oid))
+                                                   from procs), '[]' ::json))::text as "procs",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(roles) order by rolname) from roles),
+                                                 '[]' ::json))::text as "roles",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(auth_members) order by roleid, member, grantor)
+                                                  from auth_members), '[]' ::json))::text as "auth_members",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(types) order by typnamespace, typname) from types),
+                                                 '[]' ::json))::text as "types",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(enums) order by enumtypid, enumsortorder) from enums),
+                                                 '[]' ::json))::text as "enums",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(extensions) order by extname) from extensions),
+                                                 '[]' ::json))::text as "extensions",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(indexes) order by indrelid, indexrelid) from indexes),
+                                                 '[]' ::json))::text as "indexes",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(inherits) order by inhrelid, inhseqno) from inherits),
+                                                 '[]' ::json))::text as "inherits",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(languages) order by lanname) from languages),
+                                                 '[]' ::json))::text as "languages",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(policies) order by polrelid, polname) from policies),
+                                                 '[]' ::json))::text as "policies",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(ranges) order by rngtypid) from ranges),
+                                                 '[]' ::json))::text as "ranges",
+                                 (select coalesce((select json_agg(row_to_json(depends) order by classid, objid,
+                                                                   objsubid, refclassid, refobjid, refobjsubid)
+                                                   from depends), '[]' ::json))::text as "depends",
+                                 (select coalesce(
+                                                 (select json_agg(row_to_json(descriptions) order by objoid, classoid, objsubid)
+                                                  from descriptions), '[]' ::json))::text as "descriptions",
+                                 (select coalesce((select json_agg(row_to_json(am) order by amname) from am), '[]'::json))::text as "am",
+                                 (select json_object_agg(oid::text, relname order by relname asc)
+                                  from pg_class
+                                  where relnamespace = (select oid
+                                                        from pg_namespace
+                                                        where nspname = 'pg_catalog')
+                                    and relkind = 'r')::text as "catalog_by_oid",
+                                 current_user as "current_user",
+                                 version() as "pg_version",
+                                 1 as "introspection_version" \
                           """
 
-    result = await conn.fetchval(introspection_query)
+
+async def make_introspection_query(conn: Connection) -> Introspection:
+    result = await conn.fetchrow(INTROSPECTION_QUERY)
     if result:
-        introspection = Introspection.model_validate_json(result)
+        # Each catalog comes back as its own JSON column, so the lists are
+        # validated one by one instead of parsing a single document holding
+        # the whole catalog. Everything is validated at that point, so the
+        # model is constructed without walking the lists a second time.
+        introspection = Introspection.model_construct(
+            database=PgDatabase.model_validate_json(result["database"]),
+            **{
+                name: adapter.validate_json(result[name])
+                for name, adapter in _CATALOG_ADAPTERS.items()
+            },
+            catalog_by_oid=json.loads(result["catalog_by_oid"]),
+            current_user=result["current_user"],
+            pg_version=result["pg_version"],
+            introspection_version=result["introspection_version"],
+        )
         return introspection
     else:
         raise ValueError("No introspection data found.")
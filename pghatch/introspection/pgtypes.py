@@ -1,8 +1,10 @@
 import datetime
-from types import UnionType
-from typing import Optional, Tuple, List, Callable, cast
+from dataclasses import dataclass
+from types import MappingProxyType, UnionType
+from typing import Annotated, Optional, Tuple, List, Callable, cast
 
-from pydantic import Field, create_model, model_validator
+from asyncpg import types as asyncpg_types
+from pydantic import BeforeValidator, Field, create_model, model_validator
 from pydantic.alias_generators import to_camel
 from pghatch.introspection.introspection import Introspection
 from pghatch.introspection.tables import PgType, PgAttribute
@@ -22,87 +24,124 @@ __all__ = (
 
 
 # --- Custom Classes for Complex Types ---
-class Interval:
-    def __init__(
-            self,
-            years: int = 0,
-            months: int = 0,
-            days: int = 0,
-            hours: int = 0,
-            minutes: int = 0,
-            seconds: float = 0.0,
-    ):
-        self.years = years
-        self.months = months
-        self.days = days
-        self.hours = hours
-        self.minutes = minutes
-        self.seconds = seconds
+def _point(value) -> "Point":
+    # asyncpg points are (x, y) tuples
+    return value if isinstance(value, Point) else Point(value[0], value[1])
+
+
+def _db_type(cls: type) -> type:
+    """
+    Let response models accept what asyncpg decodes the column into:
+    ``timedelta`` for intervals and the ``asyncpg.types`` geometry classes.
+    """
+    return Annotated[cls, BeforeValidator(cls._from_db)]
+
 
-    def __repr__(self):
-        return f"Interval(years={self.years}, months={self.months}, days={self.days}, hours={self.hours}, minutes={self.minutes}, seconds={self.seconds})"
+# Values are built per row, so keep them slotted and immutable.
+@dataclass(slots=True, frozen=True)
+class Interval:
+    years: int = 0
+    months: int = 0
+    days: int = 0
+    hours: int = 0
+    minutes: int = 0
+    seconds: float = 0.0
+
+    @classmethod
+    def _from_db(cls, value):
+        if not isinstance(value, datetime.timedelta):
+            return value
+        # asyncpg has already folded years and months into days
+        hours, rest = divmod(value.seconds, 3600)
+        minutes, seconds = divmod(rest, 60)
+        return cls(
+            days=value.days,
+            hours=hours,
+            minutes=minutes,
+            seconds=seconds + value.microseconds / 1_000_000,
+        )
 
 
+@dataclass(slots=True, frozen=True)
 class Point:
-    def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
+    x: float
+    y: float
 
-    def __repr__(self):
-        return f"Point(x={self.x}, y={self.y})"
+    @classmethod
+    def _from_db(cls, value):
+        return _point(value) if isinstance(value, asyncpg_types.Point) else value
 
 
+@dataclass(slots=True, frozen=True)
 class Line:
-    def __init__(self, a: "Point", b: "Point"):
-        self.a = a
-        self.b = b
+    """The line ``a*x + b*y + c = 0``, as PostgreSQL stores it."""
 
-    def __repr__(self):
-        return f"Line(a={self.a}, b={self.b})"
+    a: float
+    b: float
+    c: float
 
+    @classmethod
+    def _from_db(cls, value):
+        return cls(*value) if isinstance(value, asyncpg_types.Line) else value
 
+
+@dataclass(slots=True, frozen=True)
 class LineSegment:
-    def __init__(self, a: "Point", b: "Point"):
-        self.a = a
-        self.b = b
+    a: Point
+    b: Point
 
-    def __repr__(self):
-        return f"LineSegment(a={self.a}, b={self.b})"
+    @classmethod
+    def _from_db(cls, value):
+        if not isinstance(value, asyncpg_types.LineSegment):
+            return value
+        return cls(_point(value.p1), _point(value.p2))
 
 
+@dataclass(slots=True, frozen=True)
 class Box:
-    def __init__(self, a: "Point", b: "Point"):
-        self.a = a
-        self.b = b
+    a: Point
+    b: Point
 
-    def __repr__(self):
-        return f"Box(a={self.a}, b={self.b})"
+    @classmethod
+    def _from_db(cls, value):
+        if not isinstance(value, asyncpg_types.Box):
+            return value
+        return cls(_point(value.high), _point(value.low))
 
 
+@dataclass(slots=True, frozen=True)
 class Path:
-    def __init__(self, points: List["Point"], is_open: Optional[bool] = None):
-        self.points = points
-        self.is_open = is_open
+    points: Tuple[Point, ...]
+    is_open: Optional[bool] = None
 
-    def __repr__(self):
-        return f"Path(points={self.points}, is_open={self.is_open})"
+    @classmethod
+    def _from_db(cls, value):
+        if not isinstance(value, asyncpg_types.Path):
+            return value
+        return cls(tuple(map(_point, value.points)), not value.is_closed)
 
 
+@dataclass(slots=True, frozen=True)
 class Polygon:
-    def __init__(self, points: List["Point"]):
-        self.points = points
+    points: Tuple[Point, ...]
 
-    def __repr__(self):
-        return f"Polygon(points={self.points})"
+    @classmethod
+    def _from_db(cls, value):
+        if not isinstance(value, asyncpg_types.Polygon):
+            return value
+        return cls(tuple(map(_point, value.points)))
 
 
+@dataclass(slots=True, frozen=True)
 class Circle:
-    def __init__(self, center: "Point", radius: float):
-        self.center = center
-        self.radius = radius
+    center: Point
+    radius: float
 
-    def __repr__(self):
-        return f"Circle(center={self.center}, radius={self.radius})"
+    @classmethod
+    def _from_db(cls, value):
+        if not isinstance(value, asyncpg_types.Circle):
+            return value
+        return cls(_point(value.center), value.radius)
 
 
 def _get_nullable_type(
@@ -125,13 +164,10 @@ def _get_array_type(
     """
     Returns the Python type for a PostgreSQL array based on the element type.
     """
-    if typ and not attr:
-        elem_type = typ.get_elem_type(introspection)
-        dims = typ.typndims
-    else:
+    if typ is None:
         typ = attr.get_type(introspection)
-        elem_type = typ.get_elem_type(introspection)
-        dims = attr.attndims
+    elem_type = typ.get_elem_type(introspection)
+    dims = attr.attndims if attr is not None else typ.typndims
 
     py_type = get_py_type(introspection=introspection, typ=elem_type)
 
@@ -150,7 +186,7 @@ def _get_composite_type(
     """
     Returns the Python type for a PostgreSQL composite type.
     """
-    if attr is not None:
+    if typ is None:
         typ = attr.get_type(introspection)
 
     relation = introspection.get_class(typ.typrelid)
@@ -166,7 +202,7 @@ def _get_composite_type(
     for attr in attrs:
         if attr.attisdropped:
             continue
-        py_type = get_py_type(introspection=introspection, typ=attr.atttypid, attr=attr)
+        py_type = get_py_type(introspection=introspection, attr=attr)
         field_definitions[attr.attname] = (
             py_type,
             Field(description=attr.get_description(introspection)),
@@ -232,6 +268,21 @@ def _get_enum_py_type(
 
 
 # Geometric type
+_INTERVAL_TYPE = _db_type(Interval)
+
+_GEOMETRIC_TYPES = MappingProxyType(
+    {
+        "point": _db_type(Point),
+        "line": _db_type(Line),
+        "lseg": _db_type(LineSegment),
+        "box": _db_type(Box),
+        "path": _db_type(Path),
+        "polygon": _db_type(Polygon),
+        "circle": _db_type(Circle),
+    }
+)
+
+
 def _get_geometrics_py_type(
         introspection: "Introspection",
         typ: Optional["PgType"] = None,
@@ -240,22 +291,10 @@ def _get_geometrics_py_type(
     if typ is None:
         typ = attr.get_type(introspection)
 
-    if typ.typname == "point":
-        return Point
-    elif typ.typname == "line":
-        return Line
-    elif typ.typname == "lseg":
-        return LineSegment
-    elif typ.typname == "box":
-        return Box
-    elif typ.typname == "path":
-        return Path
-    elif typ.typname == "polygon":
-        return Polygon
-    elif typ.typname == "circle":
-        return Circle
-    else:
+    py_type = _GEOMETRIC_TYPES.get(typ.typname)
+    if py_type is None:
         raise TypeError(f"Unsupported geometric type: {typ.typname}")
+    return py_type
 
 
 # Network address type
@@ -268,6 +307,22 @@ def _get_network_py_type(
 
 
 # Numeric type
+_NUMERIC_TYPES = MappingProxyType(
+    {
+        **dict.fromkeys(
+            ("integer", "int", "int2", "int4", "int8", "smallint", "bigint"), int
+        ),
+        **dict.fromkeys(
+            ("float", "float4", "float8", "double precision", "real"), float
+        ),
+        **dict.fromkeys(("numeric", "decimal"), float),
+    }
+)
+# typname comes straight from pg_type, which is always lowercase, so a single
+# probe of the bound method is enough.
+_numeric_type = _NUMERIC_TYPES.get
+
+
 def _get_numeric_py_type(
         introspection: "Introspection",
         typ: Optional["PgType"] = None,
@@ -276,14 +331,10 @@ def _get_numeric_py_type(
     if typ is None:
         typ = attr.get_type(introspection)
 
-    match typ.typname:
-        case "integer" | "int" | "int2" | "int4" | "int8" | "smallint" | "bigint":
-            return int
-        case "float" | "float4" | "float8" | "double precision" | "real":
-            return float
-        case "numeric" | "decimal":
-            return float
-    raise TypeError(f"Unsupported geometric type: {typ.typname}")
+    py_type = _numeric_type(typ.typname)
+    if py_type is None:
+        raise TypeError(f"Unsupported numeric type: {typ.typname}")
+    return py_type
 
 
 # Pseudo type
@@ -318,14 +369,8 @@ def _get_string_py_type(
     if typ is None:
         typ = attr.get_type(introspection)
 
-    match typ.typname:
-        case "text" | "varchar" | "char" | "character varying" | "character":
-            return str
-        case "bytea":
-            return bytes
-        case _:
-            return str
-    raise TypeError(f"Unsupported string type: {typ.typname}")
+    # every other string-category type (text, varchar, char, ...) maps to str
+    return bytes if typ.typname == "bytea" else str
 
 
 # Timespan types
@@ -338,7 +383,7 @@ def _get_timespan_py_type(
         typ = attr.get_type(introspection)
 
     if typ.typname == "interval":
-        return Interval
+        return _INTERVAL_TYPE
     elif typ.typname in (
             "date",
             "timestamp",
@@ -440,6 +485,27 @@ def _get_internal_py_type(
         raise TypeError(f"Unsupported internal use type: {typ.typname}")
 
 
+_CATEGORY_HANDLERS = MappingProxyType(
+    {
+        "A": _get_array_py_type,
+        "B": _get_boolean_py_type,
+        "C": _get_composite_py_type,
+        "D": _get_datetime_type,
+        "E": _get_enum_py_type,
+        "G": _get_geometrics_py_type,
+        "I": _get_network_py_type,
+        "N": _get_numeric_py_type,
+        "P": _get_pseudo_py_type,
+        "R": _get_range_py_type,
+        "S": _get_string_py_type,
+        "T": _get_timespan_py_type,
+        "U": _get_user_defined_py_type,
+        "V": _get_bitstring_py_type,
+        "X": _get_unknown_py_type,
+    }
+)
+
+
 def _get_py_type_by_category(
         introspection: "Introspection",
         typ: Optional["PgType"] = None,
@@ -468,38 +534,10 @@ def _get_py_type_by_category(
     # BIT_STRING = 'V'      # Bit-string types
     # UNKNOWN = 'X'         # Unknown types
 
-    match typ.typcategory:
-        case "A":
-            return _get_array_py_type(introspection, typ, attr)
-        case "B":
-            return _get_boolean_py_type(introspection, typ, attr)
-        case "C":
-            return _get_composite_py_type(introspection, typ, attr)
-        case "D":
-            return _get_datetime_type(introspection, typ, attr)
-        case "E":
-            return _get_enum_py_type(introspection, typ, attr)
-        case "G":
-            return _get_geometrics_py_type(introspection, typ, attr)
-        case "I":
-            return _get_network_py_type(introspection, typ, attr)
-        case "N":
-            return _get_numeric_py_type(introspection, typ, attr)
-        case "P":
-            return _get_pseudo_py_type(introspection, typ, attr)
-        case "R":
-            return _get_range_py_type(introspection, typ, attr)
-        case "S":
-            return _get_string_py_type(introspection, typ, attr)
-        case "T":
-            return _get_timespan_py_type(introspection, typ, attr)
-        case "U":
-            return _get_user_defined_py_type(introspection, typ, attr)
-        case "V":
-            return _get_bitstring_py_type(introspection, typ, attr)
-        case "X":
-            return _get_unknown_py_type(introspection, typ, attr)
-    raise str
+    handler = _CATEGORY_HANDLERS.get(typ.typcategory)
+    if handler is None:
+        raise TypeError(f"Unsupported type category: {typ.typcategory}")
+    return handler(introspection, typ, attr)
 
 
 def get_py_type(
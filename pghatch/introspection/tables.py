@@ -1,10 +1,9 @@
 import logging
 from datetime import datetime
-from functools import lru_cache
-from types import UnionType
+from types import MappingProxyType, UnionType
 from typing import Any, Optional, TYPE_CHECKING, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy import (
     ARRAY,
     BigInteger,
@@ -27,394 +26,396 @@ from sqlmodel import Field, SQLModel
 
 if TYPE_CHECKING:
     from pghatch.introspection.introspection import Introspection
-    from pghatch.introspection.acl import AclObject, OBJECT_SEQUENCE, OBJECT_TABLE
-
-RESERVED_WORDS = [
-    "ABS",
-    "ABSENT",
-    "ACOS",
-    "ALL",
-    "ALLOCATE",
-    "ANALYSE",
-    "ANALYZE",
-    "AND",
-    "ANY",
-    "ANY_VALUE",
-    "ARE",
-    "ARRAY",
-    "ARRAY_AGG",
-    "ARRAY_MAX_CARDINALITY",
-    "AS",
-    "ASC",
-    "ASENSITIVE",
-    "ASIN",
-    "ASYMMETRIC",
-    "ATAN",
-    "ATOMIC",
-    "AUTHORIZATION",
-    "AVG",
-    "BEGIN_FRAME",
-    "BEGIN_PARTITION",
-    "BETWEEN",
-    "BIGINT",
-    "BINARY",
-    "BIT",
-    "BIT_LENGTH",
-    "BLOB",
-    "BOOLEAN",
-    "BOTH",
-    "BTRIM",
-    "CALL",
-    "CARDINALITY",
-    "CASE",
-    "CAST",
-    "CEIL",
-    "CEILING",
-    "CHAR",
-    "CHARACTER",
-    "CHARACTER_LENGTH",
-    "CHAR_LENGTH",
-    "CHECK",
-    "CLASSIFIER",
-    "CLOB",
-    "COALESCE",
-    "COLLATE",
-    "COLLATION",
-    "COLLECT",
-    "COLUMN",
-    "CONCURRENTLY",
-    "CONDITION",
-    "CONNECT",
-    "CONSTRAINT",
-    "CONTAINS",
-    "CONVERT",
-    "CORR",
-    "CORRESPONDING",
-    "COS",
-    "COSH",
-    "COUNT",
-    "COVAR_POP",
-    "COVAR_SAMP",
-    "CREATE",
-    "CROSS",
-    "CUME_DIST",
-    "CURRENT_CATALOG",
-    "CURRENT_DATE",
-    "CURRENT_DEFAULT_TRANSFORM_GROUP",
-    "CURRENT_PATH",
-    "CURRENT_ROLE",
-    "CURRENT_ROW",
-    "CURRENT_SCHEMA",
-    "CURRENT_TIME",
-    "CURRENT_TIMESTAMP",
-    "CURRENT_TRANSFORM_GROUP_FOR_TYPE",
-    "CURRENT_USER",
-    "DATALINK",
-    "DATE",
-    "DAY",
-    "DEC",
-    "DECFLOAT",
-    "DECIMAL",
-    "DEFAULT",
-    "DEFERRABLE",
-    "DEFINE",
-    "DENSE_RANK",
-    "DEREF",
-    "DESC",
-    "DESCRIBE",
-    "DESCRIPTOR",
-    "DETERMINISTIC",
-    "DIAGNOSTICS",
-    "DISCONNECT",
-    "DISTINCT",
-    "DLNEWCOPY",
-    "DLPREVIOUSCOPY",
-    "DLURLCOMPLETE",
-    "DLURLCOMPLETEONLY",
-    "DLURLCOMPLETEWRITE",
-    "DLURLPATH",
-    "DLURLPATHONLY",
-    "DLURLPATHWRITE",
-    "DLURLSCHEME",
-    "DLURLSERVER",
-    "DLVALUE",
-    "DO",
-    "DYNAMIC",
-    "ELEMENT",
-    "ELSE",
-    "EMPTY",
-    "END",
-    "END-EXEC",
-    "END_FRAME",
-    "END_PARTITION",
-    "EQUALS",
-    "EVERY",
-    "EXCEPT",
-    "EXCEPTION",
-    "EXEC",
-    "EXISTS",
-    "EXP",
-    "EXTRACT",
-    "FALSE",
-    "FETCH",
-    "FILTER",
-    "FIRST_VALUE",
-    "FLOAT",
-    "FLOOR",
-    "FOR",
-    "FOREIGN",
-    "FOUND",
-    "FRAME_ROW",
-    "FREE",
-    "FREEZE",
-    "FROM",
-    "FULL",
-    "FUSION",
-    "GET",
-    "GO",
-    "GOTO",
-    "GRANT",
-    "GREATEST",
-    "GROUP",
-    "GROUPING",
-    "GROUPS",
-    "HAVING",
-    "HOUR",
-    "ILIKE",
-    "IN",
-    "INDICATOR",
-    "INITIAL",
-    "INITIALLY",
-    "INNER",
-    "INOUT",
-    "INT",
-    "INTEGER",
-    "INTERSECT",
-    "INTERSECTION",
-    "INTERVAL",
-    "INTO",
-    "IS",
-    "ISNULL",
-    "JOIN",
-    "JSON",
-    "JSON_ARRAY",
-    "JSON_ARRAYAGG",
-    "JSON_EXISTS",
-    "JSON_OBJECT",
-    "JSON_OBJECTAGG",
-    "JSON_QUERY",
-    "JSON_SCALAR",
-    "JSON_SERIALIZE",
-    "JSON_TABLE",
-    "JSON_TABLE_PRIMITIVE",
-    "JSON_VALUE",
-    "LAG",
-    "LAST_VALUE",
-    "LATERAL",
-    "LEAD",
-    "LEADING",
-    "LEAST",
-    "LEFT",
-    "LIKE",
-    "LIKE_REGEX",
-    "LIMIT",
-    "LISTAGG",
-    "LN",
-    "LOCALTIME",
-    "LOCALTIMESTAMP",
-    "LOG",
-    "LOG10",
-    "LOWER",
-    "LPAD",
-    "LTRIM",
-    "MATCHES",
-    "MATCH_NUMBER",
-    "MATCH_RECOGNIZE",
-    "MAX",
-    "MAX_CARDINALITY",
-    "MEASURES",
-    "MEMBER",
-    "MERGE",
-    "MERGE_ACTION",
-    "MIN",
-    "MINUTE",
-    "MOD",
-    "MODIFIES",
-    "MODULE",
-    "MONTH",
-    "MULTISET",
-    "NATIONAL",
-    "NATURAL",
-    "NCHAR",
-    "NCLOB",
-    "NONE",
-    "NORMALIZE",
-    "NOT",
-    "NOTNULL",
-    "NTH_VALUE",
-    "NTILE",
-    "NULL",
-    "NULLIF",
-    "NUMERIC",
-    "OCCURRENCES_REGEX",
-    "OCTET_LENGTH",
-    "OFFSET",
-    "OMIT",
-    "ON",
-    "ONE",
-    "ONLY",
-    "OPEN",
-    "OR",
-    "ORDER",
-    "OUT",
-    "OUTER",
-    "OUTPUT",
-    "OVER",
-    "OVERLAPS",
-    "OVERLAY",
-    "PAD",
-    "PARAMETER",
-    "PATTERN",
-    "PER",
-    "PERCENT",
-    "PERCENTILE_CONT",
-    "PERCENTILE_DISC",
-    "PERCENT_RANK",
-    "PERIOD",
-    "PERMUTE",
-    "PLACING",
-    "PORTION",
-    "POSITION",
-    "POSITION_REGEX",
-    "POWER",
-    "PRECEDES",
-    "PRECISION",
-    "PRIMARY",
-    "PTF",
-    "RANK",
-    "READS",
-    "REAL",
-    "REFERENCES",
-    "REGR_AVGX",
-    "REGR_AVGY",
-    "REGR_COUNT",
-    "REGR_INTERCEPT",
-    "REGR_R2",
-    "REGR_SLOPE",
-    "REGR_SXX",
-    "REGR_SXY",
-    "REGR_SYY",
-    "RESULT",
-    "RETURN",
-    "RETURNING",
-    "RIGHT",
-    "ROW",
-    "ROW_NUMBER",
-    "RPAD",
-    "RTRIM",
-    "RUNNING",
-    "SCOPE",
-    "SECOND",
-    "SECTION",
-    "SEEK",
-    "SELECT",
-    "SENSITIVE",
-    "SESSION_USER",
-    "SETOF",
-    "SIMILAR",
-    "SIN",
-    "SINH",
-    "SIZE",
-    "SMALLINT",
-    "SOME",
-    "SPACE",
-    "SPECIFIC",
-    "SPECIFICTYPE",
-    "SQLCODE",
-    "SQLERROR",
-    "SQLEXCEPTION",
-    "SQLSTATE",
-    "SQLWARNING",
-    "SQRT",
-    "STATIC",
-    "STDDEV_POP",
-    "STDDEV_SAMP",
-    "SUBMULTISET",
-    "SUBSET",
-    "SUBSTRING",
-    "SUBSTRING_REGEX",
-    "SUCCEEDS",
-    "SUM",
-    "SYMMETRIC",
-    "SYSTEM_TIME",
-    "SYSTEM_USER",
-    "TABLE",
-    "TABLESAMPLE",
-    "TAN",
-    "TANH",
-    "THEN",
-    "TIME",
-    "TIMESTAMP",
-    "TIMEZONE_HOUR",
-    "TIMEZONE_MINUTE",
-    "TO",
-    "TRAILING",
-    "TRANSLATE",
-    "TRANSLATE_REGEX",
-    "TRANSLATION",
-    "TREAT",
-    "TRIM",
-    "TRIM_ARRAY",
-    "TRUE",
-    "UESCAPE",
-    "UNION",
-    "UNIQUE",
-    "UNMATCHED",
-    "UNNEST",
-    "UPPER",
-    "USAGE",
-    "USER",
-    "USING",
-    "VALUES",
-    "VALUE_OF",
-    "VARBINARY",
-    "VARCHAR",
-    "VARIADIC",
-    "VARYING",
-    "VAR_POP",
-    "VAR_SAMP",
-    "VERBOSE",
-    "VERSIONING",
-    "WHEN",
-    "WHENEVER",
-    "WHERE",
-    "WIDTH_BUCKET",
-    "WINDOW",
-    "WITH",
-    "WITHIN",
-    "WITHOUT",
-    "XMLAGG",
-    "XMLATTRIBUTES",
-    "XMLBINARY",
-    "XMLCAST",
-    "XMLCOMMENT",
-    "XMLCONCAT",
-    "XMLDOCUMENT",
-    "XMLELEMENT",
-    "XMLEXISTS",
-    "XMLFOREST",
-    "XMLITERATE",
-    "XMLNAMESPACES",
-    "XMLPARSE",
-    "XMLPI",
-    "XMLQUERY",
-    "XMLROOT",
-    "XMLSERIALIZE",
-    "XMLTABLE",
-    "XMLTEXT",
-    "XMLVALIDATE",
-    "YEAR",
-]
+    from pghatch.introspection.acl import AclObject
+
+RESERVED_WORDS: frozenset[str] = frozenset(
+    {
+        "ABS",
+        "ABSENT",
+        "ACOS",
+        "ALL",
+        "ALLOCATE",
+        "ANALYSE",
+        "ANALYZE",
+        "AND",
+        "ANY",
+        "ANY_VALUE",
+        "ARE",
+        "ARRAY",
+        "ARRAY_AGG",
+        "ARRAY_MAX_CARDINALITY",
+        "AS",
+        "ASC",
+        "ASENSITIVE",
+        "ASIN",
+        "ASYMMETRIC",
+        "ATAN",
+        "ATOMIC",
+        "AUTHORIZATION",
+        "AVG",
+        "BEGIN_FRAME",
+        "BEGIN_PARTITION",
+        "BETWEEN",
+        "BIGINT",
+        "BINARY",
+        "BIT",
+        "BIT_LENGTH",
+        "BLOB",
+        "BOOLEAN",
+        "BOTH",
+        "BTRIM",
+        "CALL",
+        "CARDINALITY",
+        "CASE",
+        "CAST",
+        "CEIL",
+        "CEILING",
+        "CHAR",
+        "CHARACTER",
+        "CHARACTER_LENGTH",
+        "CHAR_LENGTH",
+        "CHECK",
+        "CLASSIFIER",
+        "CLOB",
+        "COALESCE",
+        "COLLATE",
+        "COLLATION",
+        "COLLECT",
+        "COLUMN",
+        "CONCURRENTLY",
+        "CONDITION",
+        "CONNECT",
+        "CONSTRAINT",
+        "CONTAINS",
+        "CONVERT",
+        "CORR",
+        "CORRESPONDING",
+        "COS",
+        "COSH",
+        "COUNT",
+        "COVAR_POP",
+        "COVAR_SAMP",
+        "CREATE",
+        "CROSS",
+        "CUME_DIST",
+        "CURRENT_CATALOG",
+        "CURRENT_DATE",
+        "CURRENT_DEFAULT_TRANSFORM_GROUP",
+        "CURRENT_PATH",
+        "CURRENT_ROLE",
+        "CURRENT_ROW",
+        "CURRENT_SCHEMA",
+        "CURRENT_TIME",
+        "CURRENT_TIMESTAMP",
+        "CURRENT_TRANSFORM_GROUP_FOR_TYPE",
+        "CURRENT_USER",
+        "DATALINK",
+        "DATE",
+        "DAY",
+        "DEC",
+        "DECFLOAT",
+        "DECIMAL",
+        "DEFAULT",
+        "DEFERRABLE",
+        "DEFINE",
+        "DENSE_RANK",
+        "DEREF",
+        "DESC",
+        "DESCRIBE",
+        "DESCRIPTOR",
+        "DETERMINISTIC",
+        "DIAGNOSTICS",
+        "DISCONNECT",
+        "DISTINCT",
+        "DLNEWCOPY",
+        "DLPREVIOUSCOPY",
+        "DLURLCOMPLETE",
+        "DLURLCOMPLETEONLY",
+        "DLURLCOMPLETEWRITE",
+        "DLURLPATH",
+        "DLURLPATHONLY",
+        "DLURLPATHWRITE",
+        "DLURLSCHEME",
+        "DLURLSERVER",
+        "DLVALUE",
+        "DO",
+        "DYNAMIC",
+        "ELEMENT",
+        "ELSE",
+        "EMPTY",
+        "END",
+        "END-EXEC",
+        "END_FRAME",
+        "END_PARTITION",
+        "EQUALS",
+        "EVERY",
+        "EXCEPT",
+        "EXCEPTION",
+        "EXEC",
+        "EXISTS",
+        "EXP",
+        "EXTRACT",
+        "FALSE",
+        "FETCH",
+        "FILTER",
+        "FIRST_VALUE",
+        "FLOAT",
+        "FLOOR",
+        "FOR",
+        "FOREIGN",
+        "FOUND",
+        "FRAME_ROW",
+        "FREE",
+        "FREEZE",
+        "FROM",
+        "FULL",
+        "FUSION",
+        "GET",
+        "GO",
+        "GOTO",
+        "GRANT",
+        "GREATEST",
+        "GROUP",
+        "GROUPING",
+        "GROUPS",
+        "HAVING",
+        "HOUR",
+        "ILIKE",
+        "IN",
+        "INDICATOR",
+        "INITIAL",
+        "INITIALLY",
+        "INNER",
+        "INOUT",
+        "INT",
+        "INTEGER",
+        "INTERSECT",
+        "INTERSECTION",
+        "INTERVAL",
+        "INTO",
+        "IS",
+        "ISNULL",
+        "JOIN",
+        "JSON",
+        "JSON_ARRAY",
+        "JSON_ARRAYAGG",
+        "JSON_EXISTS",
+        "JSON_OBJECT",
+        "JSON_OBJECTAGG",
+        "JSON_QUERY",
+        "JSON_SCALAR",
+        "JSON_SERIALIZE",
+        "JSON_TABLE",
+        "JSON_TABLE_PRIMITIVE",
+        "JSON_VALUE",
+        "LAG",
+        "LAST_VALUE",
+        "LATERAL",
+        "LEAD",
+        "LEADING",
+        "LEAST",
+        "LEFT",
+        "LIKE",
+        "LIKE_REGEX",
+        "LIMIT",
+        "LISTAGG",
+        "LN",
+        "LOCALTIME",
+        "LOCALTIMESTAMP",
+        "LOG",
+        "LOG10",
+        "LOWER",
+        "LPAD",
+        "LTRIM",
+        "MATCHES",
+        "MATCH_NUMBER",
+        "MATCH_RECOGNIZE",
+        "MAX",
+        "MAX_CARDINALITY",
+        "MEASURES",
+        "MEMBER",
+        "MERGE",
+        "MERGE_ACTION",
+        "MIN",
+        "MINUTE",
+        "MOD",
+        "MODIFIES",
+        "MODULE",
+        "MONTH",
+        "MULTISET",
+        "NATIONAL",
+        "NATURAL",
+        "NCHAR",
+        "NCLOB",
+        "NONE",
+        "NORMALIZE",
+        "NOT",
+        "NOTNULL",
+        "NTH_VALUE",
+        "NTILE",
+        "NULL",
+        "NULLIF",
+        "NUMERIC",
+        "OCCURRENCES_REGEX",
+        "OCTET_LENGTH",
+        "OFFSET",
+        "OMIT",
+        "ON",
+        "ONE",
+        "ONLY",
+        "OPEN",
+        "OR",
+        "ORDER",
+        "OUT",
+        "OUTER",
+        "OUTPUT",
+        "OVER",
+        "OVERLAPS",
+        "OVERLAY",
+        "PAD",
+        "PARAMETER",
+        "PATTERN",
+        "PER",
+        "PERCENT",
+        "PERCENTILE_CONT",
+        "PERCENTILE_DISC",
+        "PERCENT_RANK",
+        "PERIOD",
+        "PERMUTE",
+        "PLACING",
+        "PORTION",
+        "POSITION",
+        "POSITION_REGEX",
+        "POWER",
+        "PRECEDES",
+        "PRECISION",
+        "PRIMARY",
+        "PTF",
+        "RANK",
+        "READS",
+        "REAL",
+        "REFERENCES",
+        "REGR_AVGX",
+        "REGR_AVGY",
+        "REGR_COUNT",
+        "REGR_INTERCEPT",
+        "REGR_R2",
+        "REGR_SLOPE",
+        "REGR_SXX",
+        "REGR_SXY",
+        "REGR_SYY",
+        "RESULT",
+        "RETURN",
+        "RETURNING",
+        "RIGHT",
+        "ROW",
+        "ROW_NUMBER",
+        "RPAD",
+        "RTRIM",
+        "RUNNING",
+        "SCOPE",
+        "SECOND",
+        "SECTION",
+        "SEEK",
+        "SELECT",
+        "SENSITIVE",
+        "SESSION_USER",
+        "SETOF",
+        "SIMILAR",
+        "SIN",
+        "SINH",
+        "SIZE",
+        "SMALLINT",
+        "SOME",
+        "SPACE",
+        "SPECIFIC",
+        "SPECIFICTYPE",
+        "SQLCODE",
+        "SQLERROR",
+        "SQLEXCEPTION",
+        "SQLSTATE",
+        "SQLWARNING",
+        "SQRT",
+        "STATIC",
+        "STDDEV_POP",
+        "STDDEV_SAMP",
+        "SUBMULTISET",
+        "SUBSET",
+        "SUBSTRING",
+        "SUBSTRING_REGEX",
+        "SUCCEEDS",
+        "SUM",
+        "SYMMETRIC",
+        "SYSTEM_TIME",
+        "SYSTEM_USER",
+        "TABLE",
+        "TABLESAMPLE",
+        "TAN",
+        "TANH",
+        "THEN",
+        "TIME",
+        "TIMESTAMP",
+        "TIMEZONE_HOUR",
+        "TIMEZONE_MINUTE",
+        "TO",
+        "TRAILING",
+        "TRANSLATE",
+        "TRANSLATE_REGEX",
+        "TRANSLATION",
+        "TREAT",
+        "TRIM",
+        "TRIM_ARRAY",
+        "TRUE",
+        "UESCAPE",
+        "UNION",
+        "UNIQUE",
+        "UNMATCHED",
+        "UNNEST",
+        "UPPER",
+        "USAGE",
+        "USER",
+        "USING",
+        "VALUES",
+        "VALUE_OF",
+        "VARBINARY",
+        "VARCHAR",
+        "VARIADIC",
+        "VARYING",
+        "VAR_POP",
+        "VAR_SAMP",
+        "VERBOSE",
+        "VERSIONING",
+        "WHEN",
+        "WHENEVER",
+        "WHERE",
+        "WIDTH_BUCKET",
+        "WINDOW",
+        "WITH",
+        "WITHIN",
+        "WITHOUT",
+        "XMLAGG",
+        "XMLATTRIBUTES",
+        "XMLBINARY",
+        "XMLCAST",
+        "XMLCOMMENT",
+        "XMLCONCAT",
+        "XMLDOCUMENT",
+        "XMLELEMENT",
+        "XMLEXISTS",
+        "XMLFOREST",
+        "XMLITERATE",
+        "XMLNAMESPACES",
+        "XMLPARSE",
+        "XMLPI",
+        "XMLQUERY",
+        "XMLROOT",
+        "XMLSERIALIZE",
+        "XMLTABLE",
+        "XMLTEXT",
+        "XMLVALIDATE",
+        "YEAR",
+    }
+)
 
 
 class PgSQLFeatures(SQLModel, table=True):
@@ -629,9 +630,7 @@ class PgAttribute(SQLModel, table=True):
     )
 
     def get_class(self, introspection: "Introspection") -> Optional["PgClass"]:
-        return next(
-            filter(lambda x: x.relnamespace == self.attrelid, introspection.classes)
-        )
+        return introspection.get_class(self.attrelid)
 
     def get_type(self, introspection: "Introspection") -> Optional["PgType"]:
         return introspection.get_type(self.atttypid)
@@ -653,7 +652,9 @@ class PgAttribute(SQLModel, table=True):
         return tags, description
 
     def get_tags(self, introspection: "Introspection"):
-        return self.get_tags_and_description(introspection)[0]
+        return introspection.get_tags(
+            introspection.PG_CLASS, self.attrelid, self.attnum
+        )
 
     def get_acl(self, introspection: "Introspection") -> Optional["AclObject"]:
         """
@@ -811,18 +812,33 @@ class PgClass(SQLModel, table=True):
     def get_owner(self, introspection: "Introspection") -> "PgRoles":
         return introspection.get_role(self.relowner)
 
-    def get_attributes(self, introspection: "Introspection") -> list["PgAttribute"]:
+    def get_attributes(
+        self, introspection: "Introspection"
+    ) -> tuple["PgAttribute", ...]:
         return introspection.get_attributes(self.oid)
 
-    def get_constraints(self, introspection: "Introspection") -> list["PgConstraint"]:
+    def get_attributes_by_name(
+        self, introspection: "Introspection"
+    ) -> dict[str, "PgAttribute"]:
+        """Attributes keyed by attname, for resolving several columns at once."""
+        return introspection.get_attributes_by_name(self.oid)
+
+    def get_constraints(
+        self, introspection: "Introspection"
+    ) -> tuple["PgConstraint", ...]:
         return introspection.get_constraints(self.oid)
 
+    def get_constraints_by_type(
+        self, introspection: "Introspection", contype: str
+    ) -> tuple["PgConstraint", ...]:
+        return introspection.get_constraints_by_type(self.oid, contype)
+
     def get_foreign_constraints(
         self, introspection: "Introspection"
-    ) -> list["PgConstraint"]:
+    ) -> tuple["PgConstraint", ...]:
         return introspection.get_foreign_constraints(self.oid)
 
-    def get_indexes(self, introspection: "Introspection") -> list["PgIndex"]:
+    def get_indexes(self, introspection: "Introspection") -> tuple["PgIndex", ...]:
         return introspection.get_indexes(self.oid)
 
     def get_description(
@@ -837,63 +853,34 @@ class PgClass(SQLModel, table=True):
             introspection.PG_CLASS,
             self.oid,
             0,
-            {"classoid": introspection.PG_TYPE, "objoid": self.reltype},
+            (introspection.PG_TYPE, self.reltype),
         )
 
     def get_tags(self, introspection: "Introspection") -> Optional[list]:
-        tags_and_desc = self.get_tags_and_description(introspection)
-        return tags_and_desc.get("tags") if tags_and_desc else None
+        return introspection.get_tags(introspection.PG_CLASS, self.oid, 0)
 
     def get_acl(self, introspection: "Introspection") -> list["AclObject"]:
-        from pghatch.introspection.acl import parse_acls
+        from pghatch.introspection.acl import OBJECT_SEQUENCE, OBJECT_TABLE, parse_acls
 
-        objtype = (
-            OBJECT_SEQUENCE if getattr(self, "relkind", None) == "S" else OBJECT_TABLE
-        )
+        objtype = OBJECT_SEQUENCE if self.relkind == "S" else OBJECT_TABLE
         return parse_acls(introspection, self.relacl, self.relowner, objtype)
 
     def get_attribute(
         self, by, introspection: "Introspection"
     ) -> Optional["PgAttribute"]:
-        attributes = self.get_attributes(introspection)
-        if "number" in by and by["number"]:
-            return next(
-                (
-                    att
-                    for att in attributes
-                    if getattr(att, "attnum", None) == by["number"]
-                ),
-                None,
-            )
-        elif "name" in by and by["name"]:
-            return next(
-                (
-                    att
-                    for att in attributes
-                    if getattr(att, "attname", None) == by["name"]
-                ),
-                None,
-            )
+        if number := by.get("number"):
+            return introspection.get_attribute_by_num(self.oid, number)
+        elif name := by.get("name"):
+            return introspection.get_attribute_by_name(self.oid, name)
         return None
 
-    def get_inherited(self, introspection: "Introspection") -> list["PgInherits"]:
-        return [
-            inh
-            for inh in introspection.inherits
-            if getattr(inh, "inhrelid", None) == self.oid
-        ]
+    def get_inherited(
+        self, introspection: "Introspection"
+    ) -> tuple["PgInherits", ...]:
+        return introspection.get_inherits(self.oid)
 
     def get_access_method(self, introspection: "Introspection") -> Optional["PgAm"]:
-        if self.relam is not None:
-            return next(
-                (
-                    am
-                    for am in introspection.am
-                    if getattr(am, "oid", None) == self.relam
-                ),
-                None,
-            )
-        return None
+        return introspection.get_am(self.relam)
 
 
 class PgCollation(SQLModel, table=True):
@@ -1003,7 +990,9 @@ class PgConstraint(SQLModel, table=True):
         klass = self.get_class(introspection)
         if not klass:
             logging.warning(
-                f"get_attributes called on constraint {self.oid} with no class found for conrelid {self.conrelid}"
+                "get_attributes called on constraint %s with no class found for conrelid %s",
+                self.oid,
+                self.conrelid,
             )
             return []
         if not self.conkey:
@@ -1012,8 +1001,10 @@ class PgConstraint(SQLModel, table=True):
             else:
                 return None
 
-        attrs = klass.get_attributes(introspection)
-        return [attr for key in self.conkey for attr in attrs if attr.attnum == key]
+        attrs = (
+            introspection.get_attribute_by_num(klass.oid, key) for key in self.conkey
+        )
+        return [attr for attr in attrs if attr is not None]
 
     def get_type(self, introspection: "Introspection") -> Optional["PgType"]:
         """
@@ -1036,14 +1027,18 @@ class PgConstraint(SQLModel, table=True):
         foreign_class = self.get_foreign_class(introspection)
         if not foreign_class:
             logging.warning(
-                f"get_foreign_attributes called on constraint {self.oid} with no foreign class found for confrelid {self.confrelid}"
+                "get_foreign_attributes called on constraint %s with no foreign class found for confrelid %s",
+                self.oid,
+                self.confrelid,
             )
             return []
         if not self.confkey:
             return None
 
-        attrs = foreign_class.get_attributes(introspection)
-        return [attr for key in self.confkey for attr in attrs if attr.attnum == key]
+        attrs = (
+            introspection.get_attribute_by_num(foreign_class.oid, key) for key in self.confkey
+        )
+        return [attr for attr in attrs if attr is not None]
 
     def get_description(self, introspection: "Introspection") -> Optional[str]:
         """
@@ -1065,8 +1060,7 @@ class PgConstraint(SQLModel, table=True):
         """
         Get the tags associated with this constraint.
         """
-        tags_and_desc = self.get_tags_and_description(introspection)
-        return tags_and_desc.get("tags") if tags_and_desc else None
+        return introspection.get_tags(introspection.PG_CONSTRAINT, self.oid)
 
 
 class PgConversion(SQLModel, table=True):
@@ -1132,7 +1126,6 @@ class PgDatabase(SQLModel, table=True):
     def get_owner(self, introspection: "Introspection") -> Any:
         return introspection.get_role(self.datdba)
 
-    @lru_cache()
     def get_acl(self, introspection: "Introspection", OBJECT_DATABASE) -> Any:
         from pghatch.introspection.acl import parse_acls
 
@@ -1255,8 +1248,7 @@ class PgEnum(SQLModel, table=True):
         """
         Get the tags associated with this enum.
         """
-        tags_and_desc = self.get_tags_and_description(introspection)
-        return tags_and_desc.get("tags") if tags_and_desc else None
+        return introspection.get_tags(introspection.PG_ENUM, self.oid)
 
     def get_py_type(self, introspection: "Introspection") -> type:
         """
@@ -1406,13 +1398,15 @@ class PgIndex(SQLModel, table=True):
         return introspection.get_class(self.indrelid)
 
     def get_keys(self, introspection: "Introspection") -> list[Optional["PgAttribute"]]:
-        owner = self.get_class(introspection)
-        attrs = owner.get_attributes(introspection) if owner else []
-        keys = self.indkey if hasattr(self, "indkey") else []
+        keys = self.indkey or ()
+        # row_to_json emits int2vector as a json array; rows built from its
+        # text form ("1 2") are accepted as well
+        if isinstance(keys, str):
+            keys = map(int, keys.split())
         return [
             None
             if key == 0
-            else next((a for a in attrs if getattr(a, "attnum", None) == key), None)
+            else introspection.get_attribute_by_num(self.indrelid, key)
             for key in keys
         ]
 
@@ -1517,8 +1511,7 @@ class PgNamespace(SQLModel, table=True):
         return introspection.get_tags_and_description(PG_NAMESPACE, self.oid)
 
     def get_tags(self, introspection: "Introspection", PG_NAMESPACE):
-        tags_and_desc = self.get_tags_and_description(introspection, PG_NAMESPACE)
-        return tags_and_desc.get("tags") if tags_and_desc else None
+        return introspection.get_tags(PG_NAMESPACE, self.oid)
 
     def get_acl(self, introspection: "Introspection", OBJECT_SCHEMA):
         from pghatch.introspection.acl import parse_acls
@@ -1526,34 +1519,13 @@ class PgNamespace(SQLModel, table=True):
         return parse_acls(introspection, self.nspacl, self.nspowner, OBJECT_SCHEMA)
 
     def get_class(self, introspection: "Introspection", by):
-        return next(
-            (
-                child
-                for child in introspection.classes
-                if getattr(child, "relnamespace", None) == self.oid
-                and getattr(child, "relname", None) == by.get("name")
-            ),
-            None,
-        )
+        return introspection.get_class_by_name(self.oid, by.get("name"))
 
     def get_constraint(self, introspection: "Introspection", by):
-        return next(
-            (
-                child
-                for child in introspection.constraints
-                if getattr(child, "connamespace", None) == self.oid
-                and getattr(child, "conname", None) == by.get("name")
-            ),
-            None,
-        )
+        return introspection.get_constraint_by_name(self.oid, by.get("name"))
 
     def get_procs(self, introspection: "Introspection", by):
-        return [
-            child
-            for child in introspection.procs
-            if getattr(child, "pronamespace", None) == self.oid
-            and getattr(child, "proname", None) == by.get("name")
-        ]
+        return introspection.get_procs_by_name(self.oid, by.get("name"))
 
 
 class PgOpclass(SQLModel, table=True):
@@ -1679,7 +1651,22 @@ class PgPolicy(SQLModel, table=True):
     )
 
 
+# proargmodes -> (is_in, is_out, is_variadic); "t" marks RETURNS TABLE columns
+_PROC_ARG_MODES = MappingProxyType(
+    {
+        "i": (True, False, False),
+        "o": (False, True, False),
+        "b": (True, True, False),
+        "v": (True, True, True),
+        "t": (False, True, False),
+    }
+)
+
+
 class ProcArgument(BaseModel):
+    # shared between procs with the same signature, so never mutated
+    model_config = ConfigDict(frozen=True)
+
     is_in: bool
     is_out: bool
     is_variadic: bool
@@ -1764,46 +1751,47 @@ class PgProc(SQLModel, table=True):
         return introspection.get_tags_and_description(PG_PROC, self.oid)
 
     def get_tags(self, introspection: "Introspection", PG_PROC) -> Optional[list]:
-        tags_and_desc = self.get_tags_and_description(introspection, PG_PROC)
-        return tags_and_desc.get("tags") if tags_and_desc else None
+        return introspection.get_tags(PG_PROC, self.oid)
 
-    def get_arguments(self, introspection: "Introspection") -> list[ProcArgument]:
+    def get_arguments(self, introspection: "Introspection") -> tuple[ProcArgument, ...]:
+        return introspection.get_proc_arguments(self)
+
+    def build_arguments(self, introspection: "Introspection") -> list[ProcArgument]:
         args: list[ProcArgument] = list()
-        for arglist in (self.proargtypes, self.proallargtypes):
-            if not arglist:
-                continue
-
-            for idx, type_id in enumerate(arglist):
-                typ = introspection.get_type(type_id)
-                if not typ:
-                    raise ValueError(
-                        f"Argument type with OID {type_id} not found in introspection data."
-                    )
-                mode = self.proargmodes[idx] if self.proargmodes else "i"
-                is_in = mode in ("i", "b", "v")
-                is_out = mode in ("o", "b", "v")
-                is_variadic = mode == "v"
-                has_default = (
-                    idx >= len(arglist) - self.pronargdefaults
-                    if self.proargdefaults
-                    else False
+        # proallargtypes lists every argument, including OUT ones, and lines up
+        # with proargmodes; it is only set when there are non-IN arguments
+        arglist = self.proallargtypes or self.proargtypes
+        if not arglist:
+            return args
+
+        types = introspection.get_types(arglist)
+        modes = self.proargmodes or ("i",) * len(arglist)
+        # pronargdefaults counts the trailing *input* arguments with a default;
+        # OUT and TABLE arguments are interleaved in proallargtypes, so count
+        # over the input positions only
+        defaulted = ()
+        if self.pronargdefaults:
+            inputs = [idx for idx, mode in enumerate(modes) if _PROC_ARG_MODES[mode][0]]
+            defaulted = frozenset(inputs[-self.pronargdefaults:])
+        for idx, type_id in enumerate(arglist):
+            typ = types.get(type_id)
+            if not typ:
+                raise ValueError(
+                    f"Argument type with OID {type_id} not found in introspection data."
                 )
-                name = self.proargnames[idx] or None
-
-                args.append(
-                    ProcArgument(
-                        is_in=is_in,
-                        is_out=is_out,
-                        is_variadic=is_variadic,
-                        has_default=has_default,
-                        typ=typ,
-                        name=name,
-                    )
+            is_in, is_out, is_variadic = _PROC_ARG_MODES[modes[idx]]
+            has_default = idx in defaulted
+            name = (self.proargnames[idx] or None) if self.proargnames else None
+
+            args.append(
+                introspection.get_proc_argument(
+                    is_in, is_out, is_variadic, has_default, typ, name
                 )
+            )
         return args
 
     def get_acl(self, introspection: "Introspection") -> Any:
-        from pghatch.introspection.acl import parse_acls, OBJECT_FUNCTION
+        from pghatch.introspection.acl import OBJECT_FUNCTION, parse_acls
 
         return parse_acls(
             introspection,
@@ -2398,7 +2386,7 @@ class PgType(SQLModel, table=True):
 
     def get_enum_values(
         self, introspection: "Introspection"
-    ) -> Optional[list["PgEnum"]]:
+    ) -> tuple["PgEnum", ...]:
         return introspection.get_enums(self.oid)
 
     def get_range(self, introspection: "Introspection") -> Optional["PgRange"]:
@@ -2414,8 +2402,7 @@ class PgType(SQLModel, table=True):
         return introspection.get_tags_and_description(introspection.PG_TYPE, self.oid)
 
     def get_tags(self, introspection: "Introspection") -> Optional[list]:
-        tags_and_desc = self.get_tags_and_description(introspection)
-        return tags_and_desc.get("tags") if tags_and_desc else None
+        return introspection.get_tags(introspection.PG_TYPE, self.oid)
 
     def get_py_type(self, introspection: "Introspection") -> Optional[type]:
         """
@@ -2488,3 +2475,80 @@ class PgRoles(SQLModel, table=True):
         default=None, sa_column=Column("rolconfig", ARRAY(Text()))
     )
     oid: Optional[Any] = Field(default=None, sa_column=Column("oid", OID))
+
+
+# Every catalog model, in definition order, and the same keyed by table name.
+CATALOG_MODELS: tuple[type[SQLModel], ...] = (
+    PgSQLFeatures,
+    PgSQLImplementationInfo,
+    PgSQLParts,
+    PgSQLSizing,
+    PgAggregate,
+    PgAm,
+    PgAmop,
+    PgAmproc,
+    PgAttrdef,
+    PgAttribute,
+    PgAuthMembers,
+    PgAuthid,
+    PgCast,
+    PgClass,
+    PgCollation,
+    PgConstraint,
+    PgConversion,
+    PgDatabase,
+    PgDbRoleSetting,
+    PgDefaultAcl,
+    PgDepend,
+    PgDescription,
+    PgEnum,
+    PgEventTrigger,
+    PgExtension,
+    PgForeignDataWrapper,
+    PgForeignServer,
+    PgForeignTable,
+    PgIndex,
+    PgInherits,
+    PgInitPrivs,
+    PgLanguage,
+    PgLargeobject,
+    PgLargeobjectMetadata,
+    PgNamespace,
+    PgOpclass,
+    PgOperator,
+    PgOpfamily,
+    PgParameterAcl,
+    PgPartitionedTable,
+    PgPolicy,
+    PgProc,
+    PgPublication,
+    PgPublicationNamespace,
+    PgPublicationRel,
+    PgRange,
+    PgReplicationOrigin,
+    PgRewrite,
+    PgSeclabel,
+    PgSequence,
+    PgShdepend,
+    PgShdescription,
+    PgShseclabel,
+    PgStatistic,
+    PgStatisticExt,
+    PgStatisticExtData,
+    PgSubscription,
+    PgSubscriptionRel,
+    PgTablespace,
+    PgTransform,
+    PgTrigger,
+    PgTsConfig,
+    PgTsConfigMap,
+    PgTsDict,
+    PgTsParser,
+    PgTsTemplate,
+    PgType,
+    PgUserMapping,
+    PgRoles,
+)
+CATALOG_MODEL_BY_TABLE: dict[str, type[SQLModel]] = {
+    model.__tablename__: model for model in CATALOG_MODELS
+}
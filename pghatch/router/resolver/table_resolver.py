@@ -4,8 +4,9 @@ import typing
 from typing import Annotated
 
 from fastapi import APIRouter, Body
-from pglast.ast import ResTarget
+from pglast.ast import ResTarget, SelectStmt, RangeVar
 from pglast.enums import LimitOption
+from pglast.stream import RawStream
 from pydantic import Field, create_model, BaseModel
 from pydantic.alias_generators import to_camel
 
@@ -41,6 +42,7 @@ class TableViewResolver(Resolver):
         self.type, self.fields, self.return_type, self.condition_type = self._create_return_type(
             introspection
         )
+        self.sql = self._create_select_sql()
         self.router = None
 
     def _create_return_type(
@@ -90,10 +92,11 @@ class TableViewResolver(Resolver):
             description=f"Fetches data from the table or view {self.schema}.{self.name}.",
         )
 
-    async def resolve(self, input_args: BaseModel):
-        from pglast.ast import SelectStmt, A_Const, Integer, RangeVar
-        from pglast.stream import RawStream
-
+    def _create_select_sql(self) -> str:
+        """
+        Build the SELECT statement once; the column list and relation do not
+        change for the lifetime of the resolver.
+        """
         select_stmt = SelectStmt(
             targetList=[ResTarget(name=attr) for attr in self.fields],
             fromClause=[
@@ -105,15 +108,20 @@ class TableViewResolver(Resolver):
                 )
             ]
         )
+        return RawStream()(select_stmt)
 
-        sql = RawStream()(select_stmt)
+    async def resolve(self, input_args: BaseModel):
         async with self.router._pool.acquire() as conn:
-            values = await conn.fetch(sql)
+            values = await conn.fetch(self.sql)
 
-        return [self.return_type(**dict(row)) for row in values]
+        # response_model validates the payload anyway; handing it plain row
+        # mappings avoids building every row as a model twice.
+        return [dict(row) for row in values]
 
 
 if __name__ == "__main__":
+    import sys
+
     import asyncpg
 
     async def main():
@@ -123,11 +131,14 @@ if __name__ == "__main__":
         async with pool.acquire() as conn:
             introspection = await make_introspection_query(conn)
 
+        schemas = []
         for cls in introspection.classes:
             if introspection.get_namespace(
                     cls.relnamespace
             ).nspname == "public" and cls.relkind in ("r", "v", "m", "f", "p"):
                 condition_model = create_table_view_condition_model(cls.oid, introspection)
-                print(condition_model.schema_json(indent=4))
+                schemas.append(condition_model.schema_json(indent=4))
+        # one write for the whole dump instead of a flush per table
+        sys.stdout.write("\n".join(schemas) + "\n")
 
     asyncio.run(main())
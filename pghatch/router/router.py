@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from asyncio import Task
+from itertools import chain
 
 import asyncpg
 from fastapi import APIRouter, FastAPI
@@ -9,7 +9,16 @@ from contextlib import asynccontextmanager
 from pghatch.introspection.introspection import make_introspection_query
 from pghatch.router.resolver.proc_resolver import ProcResolver
 from pghatch.router.resolver.table_resolver import TableViewResolver
-from pghatch.router.watch import watch_schema
+from pghatch.router.watch import (
+    VERSION_SQL,
+    WATCH_SQL,
+    SchemaWatcher,
+    get_schema_watcher,
+)
+
+# relkind/prokind values that get mounted as routes
+TABLE_VIEW_KINDS = frozenset(("r", "v", "m", "f", "p"))
+PROC_KINDS = frozenset(("f", "p"))
 
 
 class SchemaRouter(APIRouter):
@@ -18,7 +27,7 @@ class SchemaRouter(APIRouter):
     ):
         super().__init__(**kwargs, lifespan=self.lifespan)
 
-        logging.info(f"Initializing SchemaRouter for schema: {schema}")
+        logging.info("Initializing SchemaRouter for schema: %s", schema)
         self.connection_str = connection_str
         self.schema = schema
         self.check_connection_interval = 5
@@ -26,65 +35,91 @@ class SchemaRouter(APIRouter):
         self.initialized = False
         self._pool = None
         self._app: FastAPI | None = None
-        self._watcher: Task | None = None
+        self._watcher: SchemaWatcher | None = None
+        # include_router copies routes into the app, so the app-side copies
+        # are remembered here to be removed again on restart
+        self._mounted_routes: list = []
 
     @asynccontextmanager
     async def lifespan(self, app: FastAPI):
         self._app = app
-        self._pool = await asyncpg.create_pool(dsn=self.connection_str)
-
-        logging.warning(
-            f"Starting SchemaRouter for schema: {self.schema}",
+        self._pool = await asyncpg.create_pool(
+            dsn=self.connection_str,
+            min_size=1,
+            max_size=10,
+            command_timeout=60,
+            # The introspection query gains nothing from JIT but pays for it
+            # in planning time on every restart.
+            server_settings={"jit": "off"},
         )
-        await self.start()
-
-        self.initialized = True
-        yield
-        self._watcher.cancel()
-        await asyncio.wait_for(asyncio.create_task(self._pool.close()), timeout=10)
-
-    async def watch_schema(self):
-        try:
-            await watch_schema(self.restart, self._pool, self.check_connection_interval)
-        except (Exception,) as e:
-            print(e)
-            logging.error("Connection lost")
-            await self.watch()
 
-    async def watch(self):
-        if self._watcher is not None:
-            self._watcher.cancel()
-        self._watcher = asyncio.create_task(self.watch_schema())
+        logging.warning("Starting SchemaRouter for schema: %s", self.schema)
+        async with self._pool.acquire() as conn:
+            await conn.execute(WATCH_SQL)
+        version = await self.start()
 
-    async def restart(self, a, b, c, d):
-        logging.info(
-            f"Restarting SchemaRouter for schema: {self.schema}",
+        # LISTEN needs a connection of its own; it is kept outside the pool
+        # and shared with every other router of the same database.
+        self._watcher = get_schema_watcher(
+            self.connection_str, self.check_connection_interval
         )
-        await self.start()
-
-    async def start(self):
-        for route in self.routes:
-            for app_route in self._app.routes:
-                if route == app_route:
-                    self._app.routes.remove(app_route)
-            self.routes.remove(route)
+        self._watcher.subscribe(self.restart, version)
 
+        self.initialized = True
+        yield
+        await self._watcher.unsubscribe(self.restart)
+        await asyncio.wait_for(self._pool.close(), timeout=10)
+
+    async def restart(self) -> int:
+        logging.info("Restarting SchemaRouter for schema: %s", self.schema)
+        return await self.start()
+
+    async def start(self) -> int:
+        """
+        Mount the routes of the schema and return the schema version they were
+        built from. If introspection or mounting fails, the routes of the
+        previous start stay mounted.
+        """
         async with self._pool.acquire() as conn:
+            # Read before introspecting, so DDL that lands in between shows up
+            # as a newer version and triggers another restart.
+            version = await conn.fetchval(VERSION_SQL)
             introspection = await make_introspection_query(conn)
-            for cls in introspection.classes:
-                if introspection.get_namespace(
-                    cls.relnamespace
-                ).nspname == self.schema and cls.relkind in ("r", "v", "m", "f", "p"):
-                    TableViewResolver(oid=cls.oid, introspection=introspection).mount(
-                        self
-                    )
-
-            for proc in introspection.procs:
-                if introspection.get_namespace(
-                    proc.pronamespace
-                ).nspname == self.schema and proc.prokind in ("f", "p"):
-                    ProcResolver(oid=proc.oid, introspection=introspection).mount(self)
 
-            await self.watch()
-            self._app.include_router(self)
-            self._app.openapi_schema = None
+        # Resolve the schema once instead of looking up the namespace of
+        # every class and proc, then mount everything in a single pass.
+        namespace_oid = next(
+            (ns.oid for ns in introspection.namespaces if ns.nspname == self.schema),
+            None,
+        )
+        resolvers = chain(
+            (
+                TableViewResolver(oid=cls.oid, introspection=introspection)
+                for cls in introspection.classes
+                if cls.relnamespace == namespace_oid and cls.relkind in TABLE_VIEW_KINDS
+            ),
+            (
+                ProcResolver(oid=proc.oid, introspection=introspection)
+                for proc in introspection.procs
+                if proc.pronamespace == namespace_oid and proc.prokind in PROC_KINDS
+            ),
+        )
+        previous_routes, self.routes = self.routes, []
+        try:
+            for resolver in resolvers:
+                resolver.mount(self)
+        except Exception:
+            self.routes = previous_routes
+            raise
+
+        # Only the routes this router put into the app are removed; compare by
+        # identity instead of going through APIRoute.__eq__ for every app route.
+        mounted = {id(route) for route in self._mounted_routes}
+        self._app.router.routes = [
+            route for route in self._app.router.routes if id(route) not in mounted
+        ]
+        first_route = len(self._app.router.routes)
+        self._app.include_router(self)
+        self._mounted_routes = self._app.router.routes[first_route:]
+        self._app.openapi_schema = None
+        return version
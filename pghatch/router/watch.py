@@ -1,100 +1,215 @@
 import asyncio
 import logging
+from typing import Awaitable, Callable
 
 import asyncpg
 
+# Idempotent, so every router can run it on startup without resetting the
+# version other watchers of the same database have already seen. Creating
+# the functions is itself DDL the trigger reacts to, so nothing is created
+# once both triggers are installed.
 WATCH_SQL = """
-drop schema if exists pghatch_watch cascade;
+-- serialize routers installing at the same time
+select pg_advisory_xact_lock(hashtext('pghatch_watch'));
 
-create schema pghatch_watch;
-
-create function pghatch_watch.notify_watchers_ddl() returns event_trigger as $$
+do $do$
 begin
-  perform pg_notify(
-    'pghatch_watch',
-    json_build_object(
-      'type',
-      'ddl',
-      'payload',
-      (select json_agg(json_build_object('schema', schema_name, 'command', command_tag)) from pg_event_trigger_ddl_commands() as x)
-    )::text
-  );
-end;
-$$ language plpgsql;
+  if exists (select 1 from pg_event_trigger where evtname = 'pghatch_watch_ddl')
+     and exists (select 1 from pg_event_trigger where evtname = 'pghatch_watch_drop') then
+    return;
+  end if;
 
-create function pghatch_watch.notify_watchers_drop() returns event_trigger as $$
-begin
-  perform pg_notify(
-    'pghatch_watch',
-    json_build_object(
-      'type',
-      'drop',
-      'payload',
-      (select json_agg(distinct x.schema_name) from pg_event_trigger_dropped_objects() as x)
-    )::text
+  create schema if not exists pghatch_watch;
+
+  -- A single row counting DDL commands; watchers poll it so a change is
+  -- picked up even when a notification is lost or delayed. The row is
+  -- upserted because an unlogged table is emptied by crash recovery.
+  create unlogged table if not exists pghatch_watch.version (
+    singleton boolean primary key default true check (singleton),
+    id bigint not null
   );
+
+  create or replace function pghatch_watch.notify_watchers_ddl() returns event_trigger as $$
+  begin
+    insert into pghatch_watch.version as v (id) values (1)
+    on conflict (singleton) do update set id = v.id + 1;
+    perform pg_notify('pghatch_watch', 'ddl');
+  end;
+  $$ language plpgsql;
+
+  create or replace function pghatch_watch.notify_watchers_drop() returns event_trigger as $$
+  begin
+    insert into pghatch_watch.version as v (id) values (1)
+    on conflict (singleton) do update set id = v.id + 1;
+    perform pg_notify('pghatch_watch', 'drop');
+  end;
+  $$ language plpgsql;
+
+  if not exists (select 1 from pg_event_trigger where evtname = 'pghatch_watch_ddl') then
+    create event trigger pghatch_watch_ddl
+    on ddl_command_end
+    when tag in (
+      -- Ref: https://www.postgresql.org/docs/10/static/event-trigger-matrix.html
+      'ALTER AGGREGATE',
+      'ALTER DOMAIN',
+      'ALTER EXTENSION',
+      'ALTER FOREIGN TABLE',
+      'ALTER FUNCTION',
+      'ALTER POLICY',
+      'ALTER SCHEMA',
+      'ALTER TABLE',
+      'ALTER TYPE',
+      'ALTER VIEW',
+      'COMMENT',
+      'CREATE AGGREGATE',
+      'CREATE DOMAIN',
+      'CREATE EXTENSION',
+      'CREATE FOREIGN TABLE',
+      'CREATE FUNCTION',
+      'CREATE INDEX',
+      'CREATE POLICY',
+      'CREATE RULE',
+      'CREATE SCHEMA',
+      'CREATE TABLE',
+      'CREATE TABLE AS',
+      'CREATE VIEW',
+      'DROP AGGREGATE',
+      'DROP DOMAIN',
+      'DROP EXTENSION',
+      'DROP FOREIGN TABLE',
+      'DROP FUNCTION',
+      'DROP INDEX',
+      'DROP OWNED',
+      'DROP POLICY',
+      'DROP RULE',
+      'DROP SCHEMA',
+      'DROP TABLE',
+      'DROP TYPE',
+      'DROP VIEW',
+      'GRANT',
+      'REVOKE',
+      'SELECT INTO'
+    )
+    execute procedure pghatch_watch.notify_watchers_ddl();
+  end if;
+
+  if not exists (select 1 from pg_event_trigger where evtname = 'pghatch_watch_drop') then
+    create event trigger pghatch_watch_drop
+    on sql_drop
+    execute procedure pghatch_watch.notify_watchers_drop();
+  end if;
 end;
-$$ language plpgsql;
-
-create event trigger pghatch_watch_ddl
-  on ddl_command_end
-  when tag in (
-    -- Ref: https://www.postgresql.org/docs/10/static/event-trigger-matrix.html
-    'ALTER AGGREGATE',
-    'ALTER DOMAIN',
-    'ALTER EXTENSION',
-    'ALTER FOREIGN TABLE',
-    'ALTER FUNCTION',
-    'ALTER POLICY',
-    'ALTER SCHEMA',
-    'ALTER TABLE',
-    'ALTER TYPE',
-    'ALTER VIEW',
-    'COMMENT',
-    'CREATE AGGREGATE',
-    'CREATE DOMAIN',
-    'CREATE EXTENSION',
-    'CREATE FOREIGN TABLE',
-    'CREATE FUNCTION',
-    'CREATE INDEX',
-    'CREATE POLICY',
-    'CREATE RULE',
-    'CREATE SCHEMA',
-    'CREATE TABLE',
-    'CREATE TABLE AS',
-    'CREATE VIEW',
-    'DROP AGGREGATE',
-    'DROP DOMAIN',
-    'DROP EXTENSION',
-    'DROP FOREIGN TABLE',
-    'DROP FUNCTION',
-    'DROP INDEX',
-    'DROP OWNED',
-    'DROP POLICY',
-    'DROP RULE',
-    'DROP SCHEMA',
-    'DROP TABLE',
-    'DROP TYPE',
-    'DROP VIEW',
-    'GRANT',
-    'REVOKE',
-    'SELECT INTO'
-  )
-  execute procedure pghatch_watch.notify_watchers_ddl();
-
-create event trigger pghatch_watch_drop
-  on sql_drop
-  execute procedure pghatch_watch.notify_watchers_drop();
+$do$;
 """
 
 
-async def watch_schema(
-    restart: callable, pool: asyncpg.Pool | None = None, check_connection_interval: int = 5,
-):
-    async with pool.acquire() as conn:
-        await conn.execute(WATCH_SQL)
-        await conn.add_listener("pghatch_watch", restart)
+VERSION_SQL = "select coalesce(max(id), 0) from pghatch_watch.version"
+
+
+# Upper bound for the reconnect delay, which doubles after every failed attempt.
+MAX_RECONNECT_DELAY = 60
+
+
+class SchemaWatcher:
+    """
+    One LISTEN connection per database, shared by every SchemaRouter that
+    serves a schema of it.
+
+    The schema version is polled every `check_connection_interval` seconds
+    and each subscriber whose version is behind is restarted. NOTIFY is only
+    used as a hint to poll early, so bursts of DDL collapse into a single
+    restart. Restart callbacks return the version their new routes were
+    built from.
+    """
+
+    def __init__(self, dsn: str | None, check_connection_interval: int = 5):
+        self.dsn = dsn
+        self.check_connection_interval = check_connection_interval
+        # restart callback -> schema version its routes were built from
+        self._subscribers: dict[Callable[[], Awaitable[int]], int] = {}
+        self._conn: asyncpg.Connection | None = None
+        self._task: asyncio.Task | None = None
+        self._reconnect_delay = check_connection_interval
+
+    def subscribe(self, restart: Callable[[], Awaitable[int]], version: int) -> None:
+        self._subscribers[restart] = version
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def unsubscribe(self, restart: Callable[[], Awaitable[int]]) -> None:
+        self._subscribers.pop(restart, None)
+        if self._subscribers:
+            return
+        _watchers.pop(self.dsn, None)
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+    async def _run(self) -> None:
+        while True:
+            # Any error ends only this connection, never the shared watcher;
+            # cancellation is not an Exception and still stops the task.
+            try:
+                await self._watch()
+            except Exception:
+                logging.warning(
+                    "Schema watch failed, reconnecting in %ss",
+                    self._reconnect_delay,
+                    exc_info=True,
+                )
+            if self._conn is not None:
+                self._conn.terminate()
+                self._conn = None
+            await asyncio.sleep(self._reconnect_delay)
+            self._reconnect_delay = min(
+                self._reconnect_delay * 2, MAX_RECONNECT_DELAY
+            )
+
+    async def _watch(self) -> None:
+        self._conn = conn = await asyncpg.connect(dsn=self.dsn)
+        changed = asyncio.Event()
+        await conn.add_listener("pghatch_watch", lambda *args: changed.set())
         logging.warning("Watching schema changes...")
+        self._reconnect_delay = self.check_connection_interval
+
         while True:
-            await asyncio.sleep(check_connection_interval)
-            await conn.execute("SELECT 1")
+            current = await conn.fetchval(VERSION_SQL)
+            await self._restart_outdated(current)
+            try:
+                await asyncio.wait_for(changed.wait(), self.check_connection_interval)
+            except asyncio.TimeoutError:
+                pass
+            changed.clear()
+
+    async def _restart_outdated(self, current: int) -> None:
+        for restart, version in list(self._subscribers.items()):
+            if version == current:
+                continue
+            try:
+                version = await restart()
+            except Exception:
+                # The old routes stay mounted; try again on the next poll.
+                logging.exception("Restart after schema change failed")
+                continue
+            if restart in self._subscribers:
+                self._subscribers[restart] = version
+
+
+_watchers: dict[str | None, SchemaWatcher] = {}
+
+
+def get_schema_watcher(
+    dsn: str | None, check_connection_interval: int = 5
+) -> SchemaWatcher:
+    """
+    Return the watcher of `dsn`, creating it for the first router of that
+    database.
+    """
+    watcher = _watchers.get(dsn)
+    if watcher is None:
+        watcher = _watchers[dsn] = SchemaWatcher(dsn, check_connection_interval)
+    return watcher
@@ -0,0 +1,353 @@
+"""
+Tests for the Introspection lookup helpers.
+"""
+
+import dataclasses
+
+import pytest
+
+from pghatch.introspection.introspection import Introspection
+
+
+@pytest.fixture
+def introspection(sample_introspection_data) -> Introspection:
+    return Introspection.model_validate(sample_introspection_data)
+
+
+def _proc_row(oid: str, **overrides) -> dict:
+    """A pg_proc row for `get_user(user_id int4)`, with optional overrides."""
+    return {
+        "oid": oid,
+        "proname": "get_user",
+        "pronamespace": "16384",
+        "proowner": "10",
+        "prolang": "14",
+        "procost": 100.0,
+        "prorows": 0.0,
+        "provariadic": "0",
+        "prosupport": "-",
+        "prokind": "f",
+        "prosecdef": False,
+        "proleakproof": False,
+        "proisstrict": False,
+        "proretset": False,
+        "provolatile": "v",
+        "proparallel": "u",
+        "pronargs": 1,
+        "pronargdefaults": 0,
+        "prorettype": "23",
+        "proargtypes": ["23"],
+        "proargnames": ["user_id"],
+        "prosrc": "select user_id",
+        **overrides,
+    }
+
+
+class TestIntrospectionLookups:
+    """OID-keyed lookups on Introspection."""
+
+    def test_get_class(self, introspection):
+        """Test looking up a class by OID."""
+        assert introspection.get_class("16385").relname == "users"
+        assert introspection.get_class("0") is None
+
+    def test_get_namespace(self, introspection):
+        """Test looking up a namespace by OID."""
+        assert introspection.get_namespace("16384").nspname == "test_schema"
+        assert introspection.get_namespace(None) is None
+
+    def test_get_type(self, introspection):
+        """Test looking up a type by OID."""
+        assert introspection.get_type("23").typname == "int4"
+        assert introspection.get_type("1007") is None
+
+    def test_get_role(self, introspection):
+        """Test looking up roles by OID."""
+        assert introspection.get_role("10").rolname == "postgres"
+        assert introspection.get_roles({"oid": "10"}).rolname == "postgres"
+        assert introspection.get_role("0") is None
+
+    def test_lookups_are_not_serialized(self, introspection):
+        """Test that the lookup indexes stay out of the dumped model."""
+        dumped = introspection.model_dump()
+        assert not any(key.startswith("_") for key in dumped)
+
+    def test_get_attributes_sorted_by_attnum(self, sample_introspection_data):
+        """Test that attributes are grouped by relation and ordered by attnum."""
+        id_attr = sample_introspection_data["attributes"][0]
+        name_attr = {**id_attr, "attname": "name", "attnum": 2}
+        sample_introspection_data["attributes"] = [name_attr, id_attr]
+        introspection = Introspection.model_validate(sample_introspection_data)
+
+        attrs = introspection.get_attributes("16385")
+        assert [a.attname for a in attrs] == ["id", "name"]
+        assert introspection.get_attributes("0") == ()
+
+    def test_get_attribute_by_num(self, sample_introspection_data):
+        """Test attnum lookups, including a relation with a gap in attnum."""
+        id_attr = sample_introspection_data["attributes"][0]
+        email_attr = {**id_attr, "attname": "email", "attnum": 3}
+        sample_introspection_data["attributes"] = [id_attr, email_attr]
+        introspection = Introspection.model_validate(sample_introspection_data)
+
+        assert introspection.get_attribute_by_num("16385", 1).attname == "id"
+        assert introspection.get_attribute_by_num("16385", 3).attname == "email"
+        assert introspection.get_attribute_by_num("16385", 2) is None
+        cls = introspection.get_class("16385")
+        assert cls.get_attribute({"number": 3}, introspection).attname == "email"
+
+    def test_get_attribute_by_name(self, introspection):
+        """Test attname lookups through Introspection and PgClass."""
+        assert introspection.get_attribute_by_name("16385", "id").attnum == 1
+        assert introspection.get_attribute_by_name("16385", "missing") is None
+        assert introspection.get_attribute_by_name("0", "id") is None
+        cls = introspection.get_class("16385")
+        assert cls.get_attribute({"name": "id"}, introspection).attnum == 1
+        assert cls.get_attribute({}, introspection) is None
+        assert list(cls.get_attributes_by_name(introspection)) == ["id"]
+
+    def test_attribute_get_class(self, introspection):
+        """Test that an attribute resolves to its owning relation by attrelid."""
+        attr = introspection.get_attributes("16385")[0]
+        assert attr.get_class(introspection).relname == "users"
+
+    def test_attribute_tags_and_description(self, introspection):
+        """Test that attribute tags resolve without a description lookup."""
+        attr = introspection.get_attributes("16385")[0]
+        assert attr.get_tags(introspection) is None
+        assert attr.get_tags_and_description(introspection) == (None, None)
+
+    def test_get_constraints_by_type(self, sample_introspection_data):
+        """Test constraint lookups by relation and contype."""
+        pkey = {
+            "oid": "16390",
+            "conname": "users_pkey",
+            "connamespace": "16384",
+            "contype": "p",
+            "condeferrable": False,
+            "condeferred": False,
+            "convalidated": True,
+            "conrelid": "16385",
+            "contypid": "0",
+            "conindid": "16389",
+            "conparentid": "0",
+            "confrelid": "0",
+            "confupdtype": " ",
+            "confdeltype": " ",
+            "confmatchtype": " ",
+            "conislocal": True,
+            "coninhcount": 0,
+            "connoinherit": True,
+        }
+        check = {**pkey, "oid": "16391", "conname": "users_id_check", "contype": "c"}
+        sample_introspection_data["constraints"] = [pkey, check]
+        introspection = Introspection.model_validate(sample_introspection_data)
+        cls = introspection.get_class("16385")
+
+        assert [c.conname for c in cls.get_constraints(introspection)] == [
+            "users_id_check",
+            "users_pkey",
+        ]
+        assert [
+            c.conname for c in cls.get_constraints_by_type(introspection, "p")
+        ] == ["users_pkey"]
+        assert cls.get_constraints_by_type(introspection, "f") == ()
+
+    def test_namespace_children_by_name(self, introspection):
+        """Test resolving a namespace's classes and procs by name."""
+        namespace = introspection.get_namespace("16384")
+        assert namespace.get_class(introspection, {"name": "users"}).oid == "16385"
+        assert namespace.get_class(introspection, {"name": "missing"}) is None
+        assert namespace.get_constraint(introspection, {"name": "users_pkey"}) is None
+        assert namespace.get_procs(introspection, {"name": "missing"}) == ()
+
+    def test_index_get_keys(self, sample_introspection_data):
+        """Test that int2vector index keys resolve to attributes in either form."""
+        sample_introspection_data["indexes"] = [
+            {
+                "indexrelid": "16389",
+                "indrelid": "16385",
+                "indnatts": 2,
+                "indnkeyatts": 2,
+                "indisunique": True,
+                "indnullsnotdistinct": False,
+                "indisprimary": False,
+                "indisexclusion": False,
+                "indimmediate": True,
+                "indisclustered": False,
+                "indisvalid": True,
+                "indcheckxmin": False,
+                "indisready": True,
+                "indislive": True,
+                "indisreplident": False,
+                "indkey": "1 0",
+                "indcollation": "0 0",
+                "indclass": "1978 1978",
+                "indoption": "0 0",
+            }
+        ]
+        introspection = Introspection.model_validate(sample_introspection_data)
+
+        keys = introspection.get_index({"id": "16389"}).get_keys(introspection)
+        assert [key.attname if key else None for key in keys] == ["id", None]
+
+        index = introspection.get_index({"id": "16389"})
+        index.indkey = [1, 0]
+        keys = index.get_keys(introspection)
+        assert [key.attname if key else None for key in keys] == ["id", None]
+
+    def test_proc_arguments_are_cached(self, sample_introspection_data):
+        """Test that proc arguments are built once per introspection."""
+        sample_introspection_data["procs"] = [_proc_row("16400")]
+        introspection = Introspection.model_validate(sample_introspection_data)
+        proc = introspection.get_proc("16400")
+
+        args = proc.get_arguments(introspection)
+        assert [(arg.name, arg.typ.typname, arg.is_in) for arg in args] == [
+            ("user_id", "int4", True)
+        ]
+        assert proc.get_arguments(introspection) is args
+
+    def test_proc_arguments_are_shared_between_signatures(
+        self, sample_introspection_data
+    ):
+        """Test that procs with identical arguments share ProcArgument objects."""
+        sample_introspection_data["procs"] = [
+            _proc_row("16400"),
+            _proc_row("16402", proname="get_user_again"),
+        ]
+        introspection = Introspection.model_validate(sample_introspection_data)
+
+        first = introspection.get_proc("16400").get_arguments(introspection)
+        second = introspection.get_proc("16402").get_arguments(introspection)
+        assert first is not second
+        assert first[0] is second[0]
+
+    def test_proc_arguments_with_out_params(self, sample_introspection_data):
+        """Test that OUT parameters come from proallargtypes without duplicates."""
+        sample_introspection_data["procs"] = [
+            _proc_row(
+                "16401",
+                proallargtypes=["23", "23"],
+                proargmodes=["i", "o"],
+                proargnames=None,
+            )
+        ]
+        introspection = Introspection.model_validate(sample_introspection_data)
+
+        args = introspection.get_proc("16401").get_arguments(introspection)
+        assert [(arg.is_in, arg.is_out, arg.name) for arg in args] == [
+            (True, False, None),
+            (False, True, None),
+        ]
+
+    def test_proc_defaults_skip_out_params(self, sample_introspection_data):
+        """Test that defaults count input arguments only, e.g. f(a, b = 1, OUT c)."""
+        sample_introspection_data["procs"] = [
+            _proc_row(
+                "16403",
+                pronargs=2,
+                pronargdefaults=1,
+                proargtypes=["23", "23"],
+                proallargtypes=["23", "23", "23"],
+                proargmodes=["i", "i", "o"],
+                proargnames=["a", "b", "c"],
+            )
+        ]
+        introspection = Introspection.model_validate(sample_introspection_data)
+
+        args = introspection.get_proc("16403").get_arguments(introspection)
+        assert [(arg.name, arg.has_default) for arg in args] == [
+            ("a", False),
+            ("b", True),
+            ("c", False),
+        ]
+
+    def test_class_get_acl(self, introspection):
+        """Test that a table's ACL resolves through the lazily loaded acl module."""
+        from pghatch.introspection.acl import OBJECT_TABLE
+
+        cls = introspection.get_class("16385")
+        acls = cls.get_acl(introspection)
+        assert [acl.role for acl in acls] == ["postgres"]
+        assert acls[0].select
+        # the owner default is parsed once and reused for the next object
+        assert introspection.get_default_acls("10", OBJECT_TABLE)[0] is acls[0]
+        assert cls.get_acl(introspection) == acls
+
+    def test_explicit_acls_are_parsed_once(self, introspection):
+        """Test that identical aclitem strings share one parsed AclObject."""
+        from pghatch.introspection.acl import OBJECT_TABLE, parse_acls
+
+        items = ["postgres=arwdDxtm/postgres", "=r/postgres"]
+        first = parse_acls(introspection, items, "10", OBJECT_TABLE)
+        second = parse_acls(introspection, list(items), "10", OBJECT_TABLE)
+        assert [acl.role for acl in first] == ["postgres", "public"]
+        assert all(a is b for a, b in zip(first, second))
+        assert introspection.get_parsed_acl(items[0]) is first[0]
+
+        # shared between objects, so a parsed ACL cannot be changed in place
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first[0].select = False
+
+    def test_database_get_acl(self, introspection):
+        """Test the database default ACL for public and the owner."""
+        acls = introspection.database.get_acl(introspection, "OBJECT_DATABASE")
+        assert [acl.role for acl in acls] == ["public", "postgres"]
+        assert acls[0].connect and acls[0].temporary
+        assert introspection.database.get_acl(introspection, "OBJECT_DATABASE") == acls
+
+    def test_get_inherited_and_access_method(self, introspection):
+        """Test the inherits/access method lookups for a class without either."""
+        cls = introspection.get_class("16385")
+        assert cls.get_inherited(introspection) == ()
+        assert cls.get_access_method(introspection) is None
+
+    def test_get_description(self, sample_introspection_data):
+        """Test description lookup with and without an objsubid."""
+        sample_introspection_data["descriptions"] = [
+            {"objoid": "16385", "classoid": "1259", "objsubid": 0, "description": "Users"},
+            {"objoid": "16385", "classoid": "1259", "objsubid": 1, "description": "User id"},
+        ]
+        introspection = Introspection.model_validate(sample_introspection_data)
+
+        assert introspection.get_description("1259", "16385") == "Users"
+        assert introspection.get_description("1259", "16385", 1) == "User id"
+        assert introspection.get_description("1259", "16385", 2) is None
+        assert introspection.get_description("1247", "16385") is None
+
+    def test_enum_tags_and_description(self, sample_introspection_data):
+        """Test that enum labels resolve their description through pg_enum."""
+        sample_introspection_data["catalog_by_oid"]["3501"] = "pg_enum"
+        sample_introspection_data["enums"] = [
+            {
+                "oid": "16395",
+                "enumtypid": "16394",
+                "enumsortorder": 1.0,
+                "enumlabel": "active",
+            }
+        ]
+        sample_introspection_data["descriptions"] = [
+            {"objoid": "16395", "classoid": "3501", "objsubid": 0, "description": "Active"},
+        ]
+        introspection = Introspection.model_validate(sample_introspection_data)
+        enum = introspection.get_enums("16394")[0]
+
+        assert introspection.PG_ENUM == "3501"
+        assert enum.get_tags(introspection) is None
+        assert enum.get_tags_and_description(introspection) == {"description": "Active"}
+
+    def test_get_tags_and_description_fallback(self, sample_introspection_data):
+        """Test that the fallback object is used when the primary has no description."""
+        sample_introspection_data["descriptions"] = [
+            {"objoid": "16385", "classoid": "1259", "objsubid": 0, "description": "Users"},
+        ]
+        introspection = Introspection.model_validate(sample_introspection_data)
+        fallback = ("1259", "16385", 0)
+
+        assert introspection.get_tags_and_description("1247", "16387") == {
+            "description": None
+        }
+        assert introspection.get_tags_and_description(
+            "1247", "16387", fallback=fallback
+        ) == {"description": "Users"}
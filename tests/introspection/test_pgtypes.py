@@ -0,0 +1,89 @@
+"""
+Tests for the PostgreSQL to Python type mapping.
+"""
+
+import datetime
+
+import pytest
+from asyncpg import types as asyncpg_types
+from pydantic import TypeAdapter
+
+from pghatch.introspection.introspection import Introspection
+from pghatch.introspection.pgtypes import (
+    Box,
+    Circle,
+    Interval,
+    Line,
+    LineSegment,
+    Path,
+    Point,
+    Polygon,
+    get_py_type,
+)
+
+# (oid, typname, typcategory) of the builtin types exercised below
+VALUE_TYPES = [
+    ("600", "point", "G"),
+    ("601", "lseg", "G"),
+    ("602", "path", "G"),
+    ("603", "box", "G"),
+    ("604", "polygon", "G"),
+    ("628", "line", "G"),
+    ("718", "circle", "G"),
+    ("1186", "interval", "T"),
+]
+
+
+@pytest.fixture
+def introspection(sample_introspection_data) -> Introspection:
+    int4 = sample_introspection_data["types"][0]
+    sample_introspection_data["types"] += [
+        {**int4, "oid": oid, "typname": typname, "typcategory": category}
+        for oid, typname, category in VALUE_TYPES
+    ]
+    return Introspection.model_validate(sample_introspection_data)
+
+
+def validate(introspection: Introspection, oid: str, value):
+    py_type = get_py_type(introspection=introspection, typ=introspection.get_type(oid))
+    return TypeAdapter(py_type).validate_python(value)
+
+
+class TestDatabaseValues:
+    """Validating the values asyncpg returns for interval and geometric columns."""
+
+    def test_interval_from_timedelta(self, introspection):
+        """Test that an asyncpg timedelta validates as an Interval."""
+        value = datetime.timedelta(days=3, seconds=3725, microseconds=500000)
+        assert validate(introspection, "1186", value) == Interval(
+            days=3, hours=1, minutes=2, seconds=5.5
+        )
+        assert validate(introspection, "1186", None) is None
+
+    def test_geometric_values(self, introspection):
+        """Test that asyncpg geometry values validate as the pghatch classes."""
+        a, b = Point(1.0, 2.0), Point(3.0, 4.0)
+        pa, pb = (1, 2), (3, 4)
+        assert validate(introspection, "600", asyncpg_types.Point(1, 2)) == a
+        assert validate(introspection, "601", asyncpg_types.LineSegment(pa, pb)) == (
+            LineSegment(a, b)
+        )
+        assert validate(introspection, "602", asyncpg_types.Path(pa, pb, is_closed=True)) == Path(
+            (a, b), is_open=False
+        )
+        assert validate(introspection, "603", asyncpg_types.Box(pb, pa)) == Box(b, a)
+        assert validate(introspection, "604", asyncpg_types.Polygon(pa, pb)) == (
+            Polygon((a, b))
+        )
+        assert validate(introspection, "628", asyncpg_types.Line(1, 2, 3)) == Line(
+            1.0, 2.0, 3.0
+        )
+        assert validate(introspection, "718", asyncpg_types.Circle(pa, 5)) == Circle(
+            a, 5.0
+        )
+
+    def test_values_are_hashable(self):
+        """Test that the frozen value types can be hashed, including point lists."""
+        points = (Point(0.0, 0.0), Point(1.0, 1.0))
+        assert hash(Path(points)) == hash(Path(points))
+        assert hash(Polygon(points)) == hash(Polygon(points))
@@ -0,0 +1,134 @@
+"""
+Tests for SchemaRouter route mounting.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from pghatch.introspection.introspection import Introspection
+from pghatch.router import router as router_module
+from pghatch.router.router import SchemaRouter
+from pghatch.router.watch import SchemaWatcher
+
+
+class _FakePool:
+    def __init__(self):
+        self.conn = AsyncMock()
+        self.conn.fetchval.return_value = 7
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self.conn
+
+
+class _StubResolver:
+    """Mounts a single route per table, like TableViewResolver."""
+
+    def __init__(self, oid: str, introspection: Introspection):
+        self.name = introspection.get_class(oid).relname
+
+    def mount(self, router: APIRouter):
+        async def _resolve():
+            return []
+
+        router.add_api_route(f"/test_schema/{self.name}", _resolve, methods=["POST"])
+
+
+@pytest.fixture
+def schema_router(monkeypatch, sample_introspection_data) -> SchemaRouter:
+    introspection = Introspection.model_validate(sample_introspection_data)
+    monkeypatch.setattr(
+        router_module,
+        "make_introspection_query",
+        AsyncMock(return_value=introspection),
+    )
+    monkeypatch.setattr(router_module, "TableViewResolver", _StubResolver)
+
+    router = SchemaRouter(schema="test_schema")
+    router._app = FastAPI()
+    router._pool = _FakePool()
+    return router
+
+
+class TestSchemaRouterStart:
+    """Mounting and re-mounting routes on the app."""
+
+    async def test_restart_replaces_mounted_routes(self, schema_router):
+        """Test that a restart removes the app routes of the previous start."""
+        app = schema_router._app
+        app_routes = len(app.router.routes)
+
+        assert await schema_router.start() == 7
+        assert len(app.router.routes) == app_routes + 1
+
+        await schema_router.start()
+        assert len(app.router.routes) == app_routes + 1
+        assert list(app.openapi()["paths"]) == ["/test_schema/users"]
+
+    async def test_version_is_read_before_introspection(self, schema_router):
+        """Test that DDL during introspection is not hidden behind the version."""
+        calls = []
+        conn = schema_router._pool.conn
+        conn.fetchval.side_effect = lambda *args: calls.append("version") or 7
+        router_module.make_introspection_query.side_effect = (
+            lambda conn: calls.append("introspection")
+            or router_module.make_introspection_query.return_value
+        )
+
+        await schema_router.start()
+        assert calls == ["version", "introspection"]
+
+    async def test_failed_restart_keeps_previous_routes(self, schema_router):
+        """Test that the routes of the last good start are served after a failed one."""
+        app = schema_router._app
+        await schema_router.start()
+        router_module.make_introspection_query.side_effect = RuntimeError(
+            "migration running"
+        )
+
+        with pytest.raises(RuntimeError):
+            await schema_router.start()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/test_schema/users")
+        assert response.status_code == 200
+        assert list(app.openapi()["paths"]) == ["/test_schema/users"]
+
+    async def test_failed_mount_keeps_previous_routes(self, schema_router, monkeypatch):
+        """Test that a resolver failing to mount does not drop the router's routes."""
+        await schema_router.start()
+
+        def _fail(self, router):
+            raise ValueError("unsupported type")
+
+        monkeypatch.setattr(_StubResolver, "mount", _fail)
+        with pytest.raises(ValueError):
+            await schema_router.start()
+        assert [route.path for route in schema_router.routes] == ["/test_schema/users"]
+
+
+class TestSchemaRouterWatch:
+    """Restarts driven by the schema watcher."""
+
+    async def test_failed_restart_keeps_version_and_routes(self, schema_router):
+        """Test that a failed restart is retried from the version of the last good one."""
+        app = schema_router._app
+        watcher = SchemaWatcher("postgres://localhost/watch_test")
+        watcher._subscribers[schema_router.restart] = await schema_router.start()
+        router_module.make_introspection_query.side_effect = RuntimeError(
+            "migration running"
+        )
+
+        await watcher._restart_outdated(8)
+        assert watcher._subscribers[schema_router.restart] == 7
+        assert list(app.openapi()["paths"]) == ["/test_schema/users"]
+
+        router_module.make_introspection_query.side_effect = None
+        schema_router._pool.conn.fetchval.return_value = 8
+        await watcher._restart_outdated(8)
+        assert watcher._subscribers[schema_router.restart] == 8
@@ -0,0 +1,124 @@
+"""
+Tests for the shared schema watcher.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+import pytest
+
+from pghatch.router import watch as watch_module
+from pghatch.router.watch import (
+    VERSION_SQL,
+    WATCH_SQL,
+    SchemaWatcher,
+    get_schema_watcher,
+)
+
+
+class TestSchemaWatcher:
+    """Dispatching schema versions to subscribed routers."""
+
+    async def test_one_watcher_per_database(self):
+        """Test that routers of the same database share a watcher."""
+        dsn = "postgres://localhost/watch_test"
+        watcher = get_schema_watcher(dsn)
+        other = get_schema_watcher(dsn + "_other")
+        assert get_schema_watcher(dsn) is watcher
+        assert other is not watcher
+
+        # the last unsubscribe releases the watcher
+        await watcher.unsubscribe(AsyncMock())
+        await other.unsubscribe(AsyncMock())
+        assert get_schema_watcher(dsn) is not watcher
+        await get_schema_watcher(dsn).unsubscribe(AsyncMock())
+
+    async def test_restart_only_outdated_subscribers(self):
+        """Test that a subscriber is restarted once per version change."""
+        watcher = SchemaWatcher("postgres://localhost/watch_test")
+        restart = AsyncMock(return_value=4)
+        watcher._subscribers[restart] = 3
+
+        await watcher._restart_outdated(3)
+        restart.assert_not_awaited()
+
+        await watcher._restart_outdated(4)
+        await watcher._restart_outdated(4)
+        restart.assert_awaited_once()
+
+    async def test_restart_records_the_rebuilt_version(self):
+        """Test that the version reported by the restart is kept, not the poll's."""
+        watcher = SchemaWatcher("postgres://localhost/watch_test")
+        restart = AsyncMock(return_value=5)
+        watcher._subscribers[restart] = 3
+
+        await watcher._restart_outdated(4)
+        await watcher._restart_outdated(5)
+        restart.assert_awaited_once()
+
+    async def test_failed_restart_is_retried(self):
+        """Test that a failed restart keeps the old version for the next poll."""
+        watcher = SchemaWatcher("postgres://localhost/watch_test")
+        restart = AsyncMock(side_effect=[RuntimeError("migration running"), 4])
+        watcher._subscribers[restart] = 3
+
+        await watcher._restart_outdated(4)
+        assert watcher._subscribers[restart] == 3
+
+        await watcher._restart_outdated(4)
+        assert watcher._subscribers[restart] == 4
+        assert restart.await_count == 2
+
+    async def test_watch_errors_back_off_and_retry(self, monkeypatch):
+        """Test that server errors keep the watcher alive with a growing delay."""
+        conn = MagicMock()
+        conn.add_listener = AsyncMock()
+        conn.fetchval = AsyncMock(
+            side_effect=asyncpg.UndefinedTableError("pghatch_watch.version")
+        )
+        connect = AsyncMock(
+            side_effect=[
+                asyncpg.CannotConnectNowError("the database system is starting up"),
+                asyncpg.TooManyConnectionsError("too many clients"),
+                conn,
+                asyncio.CancelledError(),
+            ]
+        )
+        sleep = AsyncMock()
+        monkeypatch.setattr(watch_module.asyncpg, "connect", connect)
+        monkeypatch.setattr(watch_module.asyncio, "sleep", sleep)
+
+        watcher = SchemaWatcher("postgres://localhost/watch_test")
+        with pytest.raises(asyncio.CancelledError):
+            await watcher._run()
+
+        assert connect.await_count == 4
+        # the successful connect resets the delay before the query fails
+        assert [call.args[0] for call in sleep.await_args_list] == [5, 10, 5]
+        conn.terminate.assert_called_once()
+
+
+@pytest.mark.integration
+class TestWatchSql:
+    """Installing the version triggers in a database."""
+
+    async def test_install_keeps_the_version(self, clean_db_connection):
+        """Test that a router starting up does not look like a schema change."""
+        await clean_db_connection.execute(WATCH_SQL)
+        version = await clean_db_connection.fetchval(VERSION_SQL)
+
+        await clean_db_connection.execute(WATCH_SQL)
+        assert await clean_db_connection.fetchval(VERSION_SQL) == version
+
+    async def test_ddl_bumps_the_version(self, clean_db_connection):
+        """Test that DDL updates the single version row."""
+        await clean_db_connection.execute(WATCH_SQL)
+        version = await clean_db_connection.fetchval(VERSION_SQL)
+
+        await clean_db_connection.execute("create temporary table watch_test (id int)")
+        assert await clean_db_connection.fetchval(VERSION_SQL) > version
+        assert (
+            await clean_db_connection.fetchval("select count(*) from pghatch_watch.version")
+            == 1
+        )